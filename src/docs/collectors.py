@@ -5,12 +5,46 @@ Following SRP, this module handles only data collection without
 cross-cutting concerns like formatting or file I/O.
 """
 
+import functools
+import os
+import re
 import subprocess
+from collections.abc import Callable, Iterator
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 from .models import ProjectMetrics, SystemInfo
 
+# Read size when scanning files for newlines; most sources fit in one read
+READ_CHUNK_SIZE = 1 << 16
+
+# File kinds counted by collect_metrics; earlier alternatives take priority
+_CLASSIFY = re.compile(
+    r"(?P<test>test.*\.py)|(?P<py>.*\.py)|(?P<docker>.*Dockerfile.*)"
+    r"|(?P<compose>docker-compose.*\.yml)|(?P<yml>.*\.yml)",
+    re.DOTALL,
+)
+
+# Parent directory suffix that identifies GitHub Actions workflow files
+_WORKFLOWS_SUFFIX = os.sep + os.path.join(".github", "workflows")
+
+# The Flask requirement itself, not extensions such as Flask-Login
+_FLASK_RE = re.compile(rb"^[ \t]*(flask(?![\w.-])[^\r\n]*)", re.M | re.I)
+
+
+def _scandir_recursive(path: str) -> Iterator[os.DirEntry[str]]:
+    """Yield every file below path, reusing the type info cached on each dirent."""
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scandir_recursive(entry.path)
+                elif entry.is_file():
+                    yield entry
+    except (FileNotFoundError, PermissionError):
+        return
+
 
 class ProjectDataCollector:
     """Collects project-specific data following SRP."""
@@ -20,22 +54,25 @@ class ProjectDataCollector:
         self.project_root = project_root
 
     def collect_metrics(self) -> ProjectMetrics:
-        """Collect project metrics without cross-cutting concerns."""
-        files_count = sum(1 for _ in self.project_root.rglob("*") if _.is_file())
-
-        # Count lines of code in Python files
-        loc = 0
-        for file_path in self.project_root.rglob("*.py"):
-            try:
-                loc += len(file_path.read_text(encoding="utf-8").splitlines())
-            except (UnicodeDecodeError, PermissionError):
+        """Collect project metrics in a single pass over the tree."""
+        files_count = loc = test_files = docker_files = github_workflows = 0
+
+        for entry in _scandir_recursive(str(self.project_root)):
+            files_count += 1
+            match = _CLASSIFY.fullmatch(entry.name)
+            if match is None:
                 continue
 
-        test_files = len(list(self.project_root.rglob("test*.py")))
-        docker_files = len(list(self.project_root.rglob("*Dockerfile*"))) + len(
-            list(self.project_root.rglob("docker-compose*.yml"))
-        )
-        github_workflows = len(list(self.project_root.rglob(".github/workflows/*.yml")))
+            kind = match.lastgroup
+            if kind in ("test", "py"):
+                # Count lines of code in Python files
+                loc += self._count_lines(entry.path)
+                test_files += kind == "test"
+            elif kind == "docker":
+                docker_files += 1
+            else:
+                docker_files += kind == "compose"
+                github_workflows += os.path.dirname(entry.path).endswith(_WORKFLOWS_SUFFIX)
 
         return ProjectMetrics(
             files_count=files_count,
@@ -45,19 +82,57 @@ class ProjectDataCollector:
             github_workflows=github_workflows,
         )
 
+    @staticmethod
+    def _count_lines(path: str) -> int:
+        """Count newline bytes in a file without decoding it."""
+        try:
+            with open(path, "rb") as f:
+                return sum(chunk.count(b"\n") for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b""))
+        except OSError:
+            return 0
+
+
+# One shell call probes both versions; missing tools print nothing
+VERSION_SEPARATOR = "---"
+if os.name == "nt":
+    VERSION_PROBE = ["cmd", "/c", f"python --version 2>NUL & echo {VERSION_SEPARATOR} & docker --version 2>NUL"]
+else:
+    VERSION_PROBE = [
+        "sh",
+        "-c",
+        f"python3 --version 2>/dev/null; echo {VERSION_SEPARATOR}; docker --version 2>/dev/null",
+    ]
+
+# Command runner with the subprocess.run calling convention
+Runner = Callable[..., Any]
+
+
+@functools.lru_cache(maxsize=None)
+def _run_once(args: tuple[str, ...], options: tuple[tuple[str, Any], ...]) -> subprocess.CompletedProcess[str]:
+    """Run a command and remember its result for the process lifetime."""
+    return subprocess.run(list(args), **dict(options))
+
+
+def run_cached(args: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+    """subprocess.run for commands whose output never changes, like version probes."""
+    return _run_once(tuple(args), tuple(sorted(kwargs.items())))
+
 
 class SystemDataCollector:
     """Collects system information following SRP."""
 
-    def __init__(self, project_root: Path) -> None:
-        """Initialize with project root path for requirements lookup."""
+    def __init__(self, project_root: Path, runner: Runner = run_cached) -> None:
+        """Initialize with project root path for requirements lookup.
+
+        The runner executes the version probes and can be replaced in tests.
+        """
         self.project_root = project_root
+        self._runner = runner
 
     def collect_system_info(self) -> SystemInfo:
         """Collect system information without cross-cutting concerns."""
-        python_version = self._get_python_version()
+        python_version, docker_version = self._get_tool_versions()
         flask_version = self._get_flask_version()
-        docker_version = self._get_docker_version()
         timestamp = datetime.now().isoformat()
 
         return SystemInfo(
@@ -67,43 +142,33 @@ class SystemDataCollector:
             timestamp=timestamp,
         )
 
-    def _get_python_version(self) -> str:
-        """Get Python version string."""
+    def _get_tool_versions(self) -> tuple[str, str]:
+        """Get the Python and Docker version strings from one shell probe."""
+        python_version = docker_version = ""
         try:
-            result = subprocess.run(
-                ["python3", "--version"],
+            result = self._runner(
+                VERSION_PROBE,
                 capture_output=True,
                 text=True,
                 check=False,
+                timeout=5,
             )
-            return result.stdout.strip()
-        except FileNotFoundError:
-            return "Python (version unknown)"
+            python_version, _, docker_version = result.stdout.partition(VERSION_SEPARATOR)
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            pass
+        return (
+            python_version.strip() or "Python (version unknown)",
+            docker_version.strip() or "Docker not available",
+        )
 
     def _get_flask_version(self) -> str:
         """Get Flask version from requirements.txt."""
         try:
             requirements_path = self.project_root / "requirements.txt"
             if requirements_path.exists():
-                content = requirements_path.read_text(encoding="utf-8")
-                for line in content.splitlines():
-                    if line.strip().lower().startswith("flask"):
-                        return line.strip()
+                match = _FLASK_RE.search(requirements_path.read_bytes())
+                if match:
+                    return match.group(1).decode("utf-8").strip()
         except Exception:
             pass
         return "Flask (version unknown)"
-
-    def _get_docker_version(self) -> str:
-        """Get Docker version string."""
-        try:
-            result = subprocess.run(
-                ["docker", "--version"],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except FileNotFoundError:
-            pass
-        return "Docker not available"
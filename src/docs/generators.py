@@ -5,15 +5,44 @@ Following SRP, this module handles only content generation logic
 without data collection or file I/O operations.
 """
 
+import os
 import subprocess
 from pathlib import Path
 
 from .models import GenerationContext
 
+# Names left out of the Python tree; matching directories are never entered
+TREE_IGNORE = frozenset(
+    {
+        ".git",
+        "__pycache__",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".venv",
+        "node_modules",
+        ".vscode",
+        ".DS_Store",
+    }
+)
+TREE_IGNORE_SUFFIXES = (".pyc", ".log")
+
+
+def _tree_visible(name: str) -> bool:
+    """Check whether a file or directory name belongs in the tree."""
+    return name not in TREE_IGNORE and not name.endswith(TREE_IGNORE_SUFFIXES)
+
 
 class StructureContentGenerator:
     """Generates project structure content following SRP."""
 
+    def __init__(self, prefer_external_tree: bool = False) -> None:
+        """Initialize generator.
+
+        The tree is rendered in Python by default; set prefer_external_tree
+        to try the ``tree`` command first.
+        """
+        self.prefer_external_tree = prefer_external_tree
+
     def generate_content(self, context: GenerationContext) -> str:
         """Generate structure document content."""
         tree = self._generate_tree(context.project_root)
@@ -96,66 +125,53 @@ and the markitdown package for enhanced markdown processing.
 
     def _generate_tree(self, project_root: Path) -> str:
         """Generate project tree structure."""
-        try:
-            # Use tree command if available, otherwise fallback to Python
-            result = subprocess.run(
-                [
-                    "tree",
-                    "-I",
-                    "__pycache__|*.pyc|.git|node_modules",
-                    str(project_root),
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            if result.returncode == 0:
-                return result.stdout
-        except FileNotFoundError:
-            pass
-
-        # Fallback to Python implementation
+        if self.prefer_external_tree:
+            try:
+                # Use tree command if requested, otherwise fallback to Python
+                result = subprocess.run(
+                    [
+                        "tree",
+                        "-I",
+                        "__pycache__|*.pyc|.git|node_modules",
+                        str(project_root),
+                    ],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                )
+                if result.returncode == 0:
+                    return result.stdout
+            except FileNotFoundError:
+                pass
+
         return self._python_tree(project_root)
 
     def _python_tree(self, project_root: Path) -> str:
-        """Fallback tree implementation in Python."""
-        lines: list[str] = []
-        ignore_dirs = {
-            ".git",
-            "__pycache__",
-            ".pytest_cache",
-            "node_modules",
-            ".vscode",
-        }
-        ignore_files = {"*.pyc", ".DS_Store", "*.log"}
-
-        def should_ignore(path: Path) -> bool:
-            """Check if path should be ignored."""
-            if path.name in ignore_dirs:
-                return True
-            return any(path.match(pattern) for pattern in ignore_files)
-
-        def walk_tree(path: Path, prefix: str = "") -> None:
+        """Tree implementation in Python using os.scandir."""
+        lines = [f"{project_root.name}/"]
+
+        def walk_tree(path: str, prefix: str) -> None:
             """Recursively walk directory tree."""
-            if should_ignore(path):
+            try:
+                with os.scandir(path) as entries:
+                    children = sorted(
+                        (entry for entry in entries if _tree_visible(entry.name)),
+                        key=lambda entry: (entry.is_file(), entry.name),
+                    )
+            except OSError:
                 return
 
-            children = sorted(
-                [p for p in path.iterdir() if not should_ignore(p)],
-                key=lambda p: (p.is_file(), p.name),
-            )
-
             for i, child in enumerate(children):
                 is_last = i == len(children) - 1
                 connector = "└── " if is_last else "├── "
                 lines.append(f"{prefix}{connector}{child.name}")
 
-                if child.is_dir():
+                # Ignored names were filtered above, so those subtrees are never entered
+                if child.is_dir(follow_symlinks=False):
                     extension = "    " if is_last else "│   "
-                    walk_tree(child, prefix + extension)
+                    walk_tree(child.path, prefix + extension)
 
-        lines.append(f"{project_root.name}/")
-        walk_tree(project_root, "")
+        walk_tree(str(project_root), "")
         return "\n".join(lines)
 
     # Public methods for testing
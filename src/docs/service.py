@@ -5,6 +5,7 @@ Following dependency inversion principle, this service coordinates
 different components without cross-cutting concerns.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .collectors import ProjectDataCollector, SystemDataCollector
@@ -39,21 +40,25 @@ class DocumentationService:
         # Ensure output directory exists
         self.output_dir.mkdir(exist_ok=True)
 
-        # Collect data
-        metrics = self._project_collector.collect_metrics()
-        system_info = self._system_collector.collect_system_info()
-
-        # Create generation context
-        context = GenerationContext(
-            project_root=self.project_root,
-            output_dir=self.output_dir,
-            metrics=metrics,
-            system_info=system_info,
-        )
-
-        # Generate documents
-        self._generate_structure_document(context)
-        self._generate_technical_document(context)
+        # Both phases pair a filesystem walk with independent work, so each
+        # runs its two halves concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Collect data
+            metrics_future = executor.submit(self._project_collector.collect_metrics)
+            system_info = self._system_collector.collect_system_info()
+
+            # Create generation context
+            context = GenerationContext(
+                project_root=self.project_root,
+                output_dir=self.output_dir,
+                metrics=metrics_future.result(),
+                system_info=system_info,
+            )
+
+            # Generate documents
+            structure_future = executor.submit(self._generate_structure_document, context)
+            self._generate_technical_document(context)
+            structure_future.result()
 
         print("✅ Documentation generation complete!")
 
@@ -6,6 +6,7 @@ consistent installation across Windows, Linux, and container environments.
 Follows MODERNIZE, HIGH COMPATIBILITY, and STANDARDIZATION principles.
 """
 
+import functools
 import platform
 import sys
 from pathlib import Path
@@ -34,10 +35,14 @@ def get_platform_info() -> dict[str, Any]:
     }
 
 
+@functools.lru_cache(maxsize=1)
 def get_setup_module() -> Union["ContainerSetupManager", "WindowsSetupManager", "LinuxSetupManager"]:
     """
     Get the appropriate setup module based on the current environment.
 
+    The manager is created once per process; ``setup_environment`` and
+    ``verify_environment`` share the same instance.
+
     Returns:
         The appropriate setup module for the current platform.
     """
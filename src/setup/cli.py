@@ -7,6 +7,7 @@ development environment on Windows, Linux, and container environments.
 """
 
 import argparse
+import logging
 import sys
 from typing import Any
 
@@ -64,6 +65,13 @@ Examples:
 
     args = parser.parse_args()
 
+    # Setup modules report progress through logging; show it like the banner
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(message)s",
+        stream=sys.stdout,
+    )
+
     # Print banner
     print("=" * 60)
     print("GOLDILOCKS ENVIRONMENT SETUP")
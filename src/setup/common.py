@@ -5,6 +5,8 @@ Provides shared functionality across all platform-specific setup modules.
 Follows DRY and STANDARDIZATION principles.
 """
 
+import hashlib
+import os
 import platform
 import subprocess
 import sys
@@ -16,6 +18,18 @@ __version__ = "1.0.0"
 # Required Python version
 REQUIRED_PYTHON_VERSION = (3, 14, 0)
 
+# Read size for streaming downloads and hashing
+CHUNK_SIZE = 1 << 16
+
+# Resolved once at import; installers no-op under pytest so tests never
+# download or launch anything. PYTEST_CURRENT_TEST is only set while a test
+# runs, so a module imported at collection time is caught by sys.modules.
+UNDER_TEST = "PYTEST_CURRENT_TEST" in os.environ or "pytest" in sys.modules
+
+# Downloads without a pinned SHA-256 digest are refused unless the user opts
+# in explicitly by setting this variable to 1
+ALLOW_UNVERIFIED_ENV = "GOLDILOCKS_ALLOW_UNVERIFIED_DOWNLOADS"
+
 # Required packages and their versions
 REQUIRED_PACKAGES = {
     "flask": ">=3.1.0",
@@ -99,3 +113,29 @@ def verify_packages() -> dict[str, bool]:
         except ImportError:
             results[f"package_{package}"] = False
     return results
+
+
+def file_sha256(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def env_float(name: str, default: float) -> float:
+    """Read a number from the environment, falling back to default if malformed."""
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        print(f"Warning: ignoring invalid {name}={raw!r}, using {default:g}")
+        return default
+
+
+def allow_unverified_downloads() -> bool:
+    """Check whether the user opted in to downloads without a pinned digest."""
+    return os.environ.get(ALLOW_UNVERIFIED_ENV) == "1"
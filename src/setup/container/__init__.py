@@ -12,7 +12,7 @@ from typing import Any
 
 from ..base import BaseSetupManager
 from .health_checks import is_container_ready, run_health_checks
-from .optimizer import optimize_container
+from .optimizer import CONTAINER_ENV_VARS, optimize_container
 
 __version__ = "1.0.0"
 
@@ -50,16 +50,8 @@ class ContainerSetupManager(BaseSetupManager):
                 return False
 
             # Container-specific environment variables
-            container_env_vars = {
-                "PYTHONUNBUFFERED": "1",
-                "PYTHONDONTWRITEBYTECODE": "1",
-                "PYTHONHASHSEED": "random",
-                "PIP_NO_CACHE_DIR": "1",
-                "PIP_DISABLE_PIP_VERSION_CHECK": "1",
-            }
-
-            for key, value in container_env_vars.items():
-                os.environ[key] = value
+            os.environ.update(CONTAINER_ENV_VARS)
+            for key, value in CONTAINER_ENV_VARS.items():
                 print(f"Set {key}={value}")
 
             return True
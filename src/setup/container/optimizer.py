@@ -6,6 +6,7 @@ and resource efficiency improvements.
 Follows LIGHTWEIGHT and LOW FOOTPRINT principles.
 """
 
+import glob
 import os
 import shutil
 import subprocess
@@ -13,6 +14,18 @@ from pathlib import Path
 
 __version__ = "1.0.0"
 
+# Container-optimized environment variables
+CONTAINER_ENV_VARS = {
+    "PYTHONUNBUFFERED": "1",
+    "PYTHONDONTWRITEBYTECODE": "1",
+    "PYTHONHASHSEED": "random",
+    "PIP_NO_CACHE_DIR": "1",
+    "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+}
+
+# System-wide environment file read by PAM for new sessions
+SYSTEM_ENVIRONMENT_FILE = Path("/etc/environment")
+
 
 def clean_package_cache() -> bool:
     """Clean package manager caches to reduce container size."""
@@ -41,32 +54,50 @@ def clean_package_cache() -> bool:
         return False
 
 
+def _remove_path(path: Path) -> None:
+    """Remove a file or directory tree, ignoring ones that vanish or are protected."""
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        path.unlink(missing_ok=True)
+
+
 def remove_unnecessary_files() -> bool:
     """Remove unnecessary files to reduce container image size."""
     print("Removing unnecessary files...")
 
-    files_to_remove = [
+    # Contents of system cache directories
+    system_patterns = [
         "/var/lib/apt/lists/*",
         "/tmp/*",
         "/var/tmp/*",
-        "**/*.pyc",
-        "**/__pycache__",
-        "**/*.pyo",
-        "**/*.egg-info",
+    ]
+
+    # Build artifacts anywhere under the working directory
+    project_patterns = [
+        "__pycache__",
+        "*.pyc",
+        "*.pyo",
+        "*.egg-info",
     ]
 
     try:
-        for pattern in files_to_remove:
-            if "*" in pattern:
-                # Use shell for glob patterns
-                subprocess.run(f"rm -rf {pattern}", shell=True, check=False)
-            else:
-                path = Path(pattern)
-                if path.exists():
-                    if path.is_dir():
-                        shutil.rmtree(path)
-                    else:
-                        path.unlink()
+        for pattern in system_patterns:
+            for match in glob.glob(pattern):
+                try:
+                    _remove_path(Path(match))
+                except OSError:
+                    # Skip protected or read-only entries like rm -rf did
+                    continue
+
+        # Single in-process walk per pattern instead of a shell per pattern;
+        # rglob also recurses, which an unquoted ``**`` in sh does not
+        for pattern in project_patterns:
+            for path in list(Path(".").rglob(pattern)):
+                try:
+                    _remove_path(path)
+                except OSError:
+                    continue
 
         print("Unnecessary files removed successfully")
         return True
@@ -81,9 +112,9 @@ def optimize_python_bytecode() -> bool:
     print("Optimizing Python bytecode...")
 
     try:
-        # Compile Python files to bytecode
+        # Compile Python files to bytecode using every available CPU (-j 0)
         result = subprocess.run(
-            ["python", "-m", "compileall", "-b", "."],
+            ["python", "-m", "compileall", "-b", "-j", "0", "-q", "."],
             capture_output=True,
             text=True,
         )
@@ -100,24 +131,43 @@ def optimize_python_bytecode() -> bool:
         return False
 
 
+def persist_environment(env_vars: dict[str, str]) -> bool:
+    """
+    Append environment variables to /etc/environment so later processes inherit them.
+
+    Keys already present in the file are left untouched, which makes repeated
+    calls a no-op once the variables have been persisted.
+
+    Returns:
+        True if the file holds all variables afterwards, False if it is not writable.
+    """
+    if not os.access(SYSTEM_ENVIRONMENT_FILE, os.W_OK):
+        return False
+
+    content = SYSTEM_ENVIRONMENT_FILE.read_text(encoding="utf-8")
+    existing_keys = {line.split("=", 1)[0].strip() for line in content.splitlines() if "=" in line}
+    missing = {key: value for key, value in env_vars.items() if key not in existing_keys}
+
+    if missing:
+        with open(SYSTEM_ENVIRONMENT_FILE, "a", encoding="utf-8") as f:
+            if content and not content.endswith("\n"):
+                f.write("\n")
+            f.writelines(f"{key}={value}\n" for key, value in missing.items())
+
+    return True
+
+
 def setup_minimal_environment() -> bool:
     """Setup minimal environment variables for containers."""
     print("Setting up minimal container environment...")
 
     try:
-        # Container-optimized environment variables
-        container_env_vars = {
-            "PYTHONUNBUFFERED": "1",
-            "PYTHONDONTWRITEBYTECODE": "1",
-            "PYTHONHASHSEED": "random",
-            "PIP_NO_CACHE_DIR": "1",
-            "PIP_DISABLE_PIP_VERSION_CHECK": "1",
-        }
-
-        for key, value in container_env_vars.items():
-            os.environ[key] = value
-
-        print("Container environment variables set")
+        os.environ.update(CONTAINER_ENV_VARS)
+
+        if persist_environment(CONTAINER_ENV_VARS):
+            print("Container environment variables set and persisted")
+        else:
+            print("Container environment variables set")
         return True
 
     except Exception as e:
@@ -125,24 +175,32 @@ def setup_minimal_environment() -> bool:
         return False
 
 
+def _directory_size(root: Path) -> int:
+    """Sum the size of all regular files under a directory without following links."""
+    total = 0
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for name in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, name)).st_size
+            except OSError:
+                continue
+    return total
+
+
 def get_container_stats() -> dict[str, str]:
     """Get container resource statistics."""
     stats: dict[str, str] = {}
 
     try:
-        # Get disk usage
-        result = subprocess.run(["du", "-sh", "."], capture_output=True, text=True)
-
-        if result.returncode == 0:
-            stats["disk_usage"] = result.stdout.strip().split()[0]
+        # Get disk usage in-process rather than forking du
+        stats["disk_usage"] = f"{_directory_size(Path('.')) // 1024} kB"
 
         # Get memory info if available
-        if Path("/proc/meminfo").exists():
-            with open("/proc/meminfo") as f:
-                for line in f:
-                    if line.startswith("MemAvailable:"):
-                        stats["memory_available"] = line.split()[1] + " kB"
-                        break
+        meminfo_path = Path("/proc/meminfo")
+        if meminfo_path.exists():
+            meminfo = dict(line.split(":", 1) for line in meminfo_path.read_text().splitlines() if ":" in line)
+            if "MemAvailable" in meminfo:
+                stats["memory_available"] = meminfo["MemAvailable"].strip()
 
         return stats
 
@@ -6,7 +6,9 @@ package management, and system configuration.
 Follows MODERNIZE and SEPARATION OF CONCERNS principles.
 """
 
+import functools
 import os
+import platform
 import sys
 from typing import Any
 
@@ -17,35 +19,39 @@ from .tools import install_all_tools, verify_linux_tools
 
 __version__ = "1.0.0"
 
+# Host details that cannot change while the process runs
+_MACHINE = platform.machine()
+_KERNEL = platform.release()
+
+
+@functools.cache
+def _read_os_release() -> dict[str, str]:
+    """Parse /etc/os-release once per process."""
+    os_release: dict[str, str] = {}
+    try:
+        with open("/etc/os-release") as f:
+            for line in f:
+                key, sep, value = line.strip().partition("=")
+                if sep:
+                    os_release[key] = value.strip('"')
+    except OSError:
+        pass
+    return os_release
+
 
 class LinuxSetupManager(BaseSetupManager):
     """Manages Linux-specific setup and installation."""
 
     def _get_platform_info(self) -> dict[str, Any]:
         """Get Linux-specific platform information."""
-        import platform
-
-        try:
-            # Try to get distribution info
-            os_release: dict[str, str] = {}
-            with open("/etc/os-release") as f:
-                for line in f:
-                    if "=" in line:
-                        key, value = line.strip().split("=", 1)
-                        os_release[key] = value.strip('"')
-
-            distro = os_release.get("ID", "unknown")
-            version = os_release.get("VERSION_ID", "unknown")
-        except Exception:
-            distro = "unknown"
-            version = "unknown"
+        os_release = _read_os_release()
 
         return {
             "system": "linux",
-            "distribution": distro,
-            "version": version,
-            "architecture": platform.machine(),
-            "kernel": platform.release(),
+            "distribution": os_release.get("ID", "unknown"),
+            "version": os_release.get("VERSION_ID", "unknown"),
+            "architecture": _MACHINE,
+            "kernel": _KERNEL,
             "python_version": sys.version_info,
             "python_executable": sys.executable,
         }
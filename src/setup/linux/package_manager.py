@@ -5,26 +5,78 @@ Handles system package installation and management on Linux distributions.
 Follows MODERNIZE and HIGH COMPATIBILITY principles.
 """
 
+import functools
+import shutil
 import subprocess
+import time
+from pathlib import Path
 
-from ..common import run_command
+from ..common import env_float, run_command
 
 __version__ = "1.0.0"
 
-
+# Command prefixes per package manager; sudo is added by run_command only
+# when not already running as root
+UPDATE_COMMANDS: dict[str, tuple[str, ...]] = {
+    "apt": ("apt", "update"),
+    "yum": ("yum", "check-update"),
+    "dnf": ("dnf", "check-update"),
+    "pacman": ("pacman", "-Sy"),
+    "zypper": ("zypper", "refresh"),
+}
+
+INSTALL_COMMANDS: dict[str, tuple[str, ...]] = {
+    "apt": ("apt", "install", "-y"),
+    "yum": ("yum", "install", "-y"),
+    "dnf": ("dnf", "install", "-y"),
+    "pacman": ("pacman", "-S", "--noconfirm"),
+    "zypper": ("zypper", "install", "-y"),
+}
+
+# Metadata directories refreshed by each manager's update command
+PACKAGE_LIST_DIRS: dict[str, Path] = {
+    "apt": Path("/var/lib/apt/lists"),
+    "yum": Path("/var/cache/yum"),
+    "dnf": Path("/var/cache/dnf"),
+}
+
+# Index files each update command writes into its metadata directory. The
+# directory's own mtime is not used: deleting the lists (slim base images,
+# optimizer cleanup) bumps it while leaving nothing installable.
+PACKAGE_INDEX_PATTERNS: dict[str, tuple[str, ...]] = {
+    "apt": ("*_Packages*", "*_InRelease"),
+    "yum": ("**/repomd.xml",),
+    "dnf": ("**/repomd.xml",),
+}
+
+# Touched after every successful update where the distribution installs the hook
+PACKAGE_UPDATE_STAMPS: dict[str, Path] = {
+    "apt": Path("/var/lib/apt/periodic/update-success-stamp"),
+}
+
+CHECK_COMMANDS: dict[str, tuple[str, ...]] = {
+    "apt": ("dpkg", "-l"),
+    "yum": ("rpm", "-q"),
+    "dnf": ("rpm", "-q"),
+    "pacman": ("pacman", "-Q"),
+    "zypper": ("rpm", "-q"),
+}
+
+
+@functools.lru_cache(maxsize=1)
 def detect_package_manager() -> str:
-    """Detect the available package manager on the system."""
-    managers = {
-        "apt": ["apt", "--version"],
-        "yum": ["yum", "--version"],
-        "dnf": ["dnf", "--version"],
-        "pacman": ["pacman", "--version"],
-        "zypper": ["zypper", "--version"],
-    }
+    """Detect the available package manager on the system.
+
+    The result is cached for the process lifetime since the package
+    manager cannot change while setup is running.
+    """
+    for manager in ("apt", "dnf", "yum", "pacman", "zypper"):
+        # Skip managers that are not on PATH without forking a process
+        if shutil.which(manager) is None:
+            continue
 
-    for manager, test_cmd in managers.items():
         try:
-            result = subprocess.run(test_cmd, capture_output=True, timeout=5)
+            result = subprocess.run([manager, "--version"], capture_output=True, timeout=5)
             if result.returncode == 0:
                 return manager
         except Exception:
@@ -33,21 +85,46 @@ def detect_package_manager() -> str:
     return "unknown"
 
 
+def is_package_list_fresh(manager: str) -> bool:
+    """
+    Check whether the package lists were refreshed recently enough to reuse.
+
+    Freshness is judged from the downloaded index files (and apt's update
+    stamp when present), never from the directory, so an emptied lists
+    directory always triggers an update. The window defaults to one hour
+    and can be changed with PACKAGE_LIST_TTL (seconds); set it to 0 to
+    always update.
+    """
+    lists_dir = PACKAGE_LIST_DIRS.get(manager)
+    if lists_dir is None or not lists_dir.is_dir():
+        return False
+
+    try:
+        mtimes = [
+            path.stat().st_mtime
+            for pattern in PACKAGE_INDEX_PATTERNS[manager]
+            for path in lists_dir.glob(pattern)
+            if path.is_file()
+        ]
+        if not mtimes:
+            # No index files at all, so an update is required before installing
+            return False
+        stamp = PACKAGE_UPDATE_STAMPS.get(manager)
+        if stamp is not None and stamp.is_file():
+            mtimes.append(stamp.stat().st_mtime)
+    except OSError:
+        return False
+
+    return time.time() - max(mtimes) < env_float("PACKAGE_LIST_TTL", 3600.0)
+
+
 def update_package_list() -> bool:
     """Update the package manager's package list."""
     manager = detect_package_manager()
 
-    update_commands = {
-        "apt": ["sudo", "apt", "update"],
-        "yum": ["sudo", "yum", "check-update"],
-        "dnf": ["sudo", "dnf", "check-update"],
-        "pacman": ["sudo", "pacman", "-Sy"],
-        "zypper": ["sudo", "zypper", "refresh"],
-    }
-
-    if manager in update_commands:
+    if manager in UPDATE_COMMANDS:
         print(f"Updating package list using {manager}...")
-        return_code, _, _ = run_command(update_commands[manager])
+        return_code, _, _ = run_command(list(UPDATE_COMMANDS[manager]), use_sudo=True)
         return return_code == 0
     else:
         print(f"Unknown package manager: {manager}")
@@ -58,17 +135,9 @@ def install_system_packages(packages: list[str]) -> bool:
     """Install system packages using the detected package manager."""
     manager = detect_package_manager()
 
-    install_commands = {
-        "apt": ["sudo", "apt", "install", "-y"] + packages,
-        "yum": ["sudo", "yum", "install", "-y"] + packages,
-        "dnf": ["sudo", "dnf", "install", "-y"] + packages,
-        "pacman": ["sudo", "pacman", "-S", "--noconfirm"] + packages,
-        "zypper": ["sudo", "zypper", "install", "-y"] + packages,
-    }
-
-    if manager in install_commands:
+    if manager in INSTALL_COMMANDS:
         print(f"Installing packages using {manager}: {' '.join(packages)}")
-        return_code, _, _ = run_command(install_commands[manager])
+        return_code, _, _ = run_command([*INSTALL_COMMANDS[manager], *packages], use_sudo=True)
         return return_code == 0
     else:
         print(f"Unknown package manager: {manager}")
@@ -79,17 +148,9 @@ def check_package_installed(package: str) -> bool:
     """Check if a system package is installed."""
     manager = detect_package_manager()
 
-    check_commands = {
-        "apt": ["dpkg", "-l", package],
-        "yum": ["rpm", "-q", package],
-        "dnf": ["rpm", "-q", package],
-        "pacman": ["pacman", "-Q", package],
-        "zypper": ["rpm", "-q", package],
-    }
-
-    if manager in check_commands:
+    if manager in CHECK_COMMANDS:
         try:
-            result = subprocess.run(check_commands[manager], capture_output=True, timeout=10)
+            result = subprocess.run([*CHECK_COMMANDS[manager], package], capture_output=True, timeout=10)
             return result.returncode == 0
         except Exception:
             return False
@@ -176,8 +237,10 @@ def install_development_environment() -> bool:
         print(f"Development packages not defined for {manager}")
         return False
 
-    # Update package list first
-    if not update_package_list():
+    # Update package list first, unless a recent run already did
+    if is_package_list_fresh(manager):
+        print(f"Package lists for {manager} are fresh; skipping update")
+    elif not update_package_list():
         print("Warning: Failed to update package list")
 
     # Install development packages
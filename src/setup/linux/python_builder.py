@@ -5,16 +5,28 @@ Handles Python 3.14.0rc3 installation from source on Linux systems.
 Follows MODERNIZE and HIGH COMPATIBILITY principles.
 """
 
+import hashlib
+import os
+import shutil
 import subprocess
 import sys
+import tarfile
+import urllib.request
 from pathlib import Path
 
-from ..common import REQUIRED_PYTHON_VERSION, run_command
+from ..common import CHUNK_SIZE, REQUIRED_PYTHON_VERSION, file_sha256, run_command
 
 __version__ = "1.0.0"
 
 # Python source download information
 PYTHON_SOURCE_URL = "https://www.python.org/ftp/python/3.14.0/Python-3.14.0rc3.tgz"
+# SHA-256 published for the tarball on python.org; downloads that do not match
+# are rejected. PYTHON_SOURCE_SHA256 overrides it when building another tarball.
+PYTHON_SOURCE_SHA256 = (
+    os.environ.get("PYTHON_SOURCE_SHA256") or "f52c3fa94a02adf9a6228abf53f6a53f09ce06aa168d879a332054c598179853"
+).lower()
+# Compiler wrapper directory put first on PATH when ccache is installed
+CCACHE_DIR = "/usr/lib/ccache"
 BUILD_DEPENDENCIES = [
     "build-essential",
     "zlib1g-dev",
@@ -25,7 +37,6 @@ BUILD_DEPENDENCIES = [
     "libreadline-dev",
     "libffi-dev",
     "libsqlite3-dev",
-    "wget",
     "libbz2-dev",
     "libgdbm-compat-dev",
     "liblzma-dev",
@@ -52,6 +63,22 @@ def install_build_dependencies() -> bool:
     return True
 
 
+def is_cached_source_valid(tarball_path: Path) -> bool:
+    """
+    Check whether a previously downloaded tarball can be reused.
+
+    The tarball must match the pinned digest, so partial, corrupted or
+    tampered files are never reused.
+    """
+    if not tarball_path.is_file():
+        return False
+
+    try:
+        return file_sha256(tarball_path) == PYTHON_SOURCE_SHA256
+    except OSError:
+        return False
+
+
 def download_python_source() -> tuple[bool, Path]:
     """Download Python source code."""
     print("Downloading Python 3.14.0rc3 source...")
@@ -61,13 +88,29 @@ def download_python_source() -> tuple[bool, Path]:
 
     tarball_path = source_dir / "Python-3.14.0rc3.tgz"
 
-    # Download source
-    cmd = ["wget", "-O", str(tarball_path), PYTHON_SOURCE_URL]
-    if not run_command(cmd):
-        print("Failed to download Python source")
+    if is_cached_source_valid(tarball_path):
+        print("Using cached Python source")
+        return True, tarball_path
+
+    # Stream to disk and hash in the same pass instead of forking wget
+    digest = hashlib.sha256()
+    try:
+        with urllib.request.urlopen(PYTHON_SOURCE_URL, timeout=60) as response, open(tarball_path, "wb") as f:
+            while chunk := response.read(CHUNK_SIZE):
+                f.write(chunk)
+                digest.update(chunk)
+    except Exception as e:
+        print(f"Failed to download Python source: {e}")
+        tarball_path.unlink(missing_ok=True)
+        return False, tarball_path
+
+    sha256 = digest.hexdigest()
+    if sha256 != PYTHON_SOURCE_SHA256:
+        print(f"Checksum mismatch for Python source: expected {PYTHON_SOURCE_SHA256}, got {sha256}")
+        tarball_path.unlink(missing_ok=True)
         return False, tarball_path
 
-    print("Python source downloaded successfully")
+    print("Python source downloaded and verified successfully")
     return True, tarball_path
 
 
@@ -76,49 +119,67 @@ def extract_and_build_python(tarball_path: Path) -> bool:
     print("Extracting and building Python...")
 
     source_dir = tarball_path.parent
+    python_src_dir = source_dir / "Python-3.14.0rc3"
 
-    # Extract tarball
-    cmd = ["tar", "-xzf", str(tarball_path), "-C", str(source_dir)]
-    if not run_command(cmd):
-        print("Failed to extract Python source")
+    # Extract tarball in-process, reusing a previous complete extraction of
+    # this same tarball; the marker records its digest once extraction finishes
+    extracted_marker = source_dir / ".Python-3.14.0rc3.extracted"
+    try:
+        tarball_sha256 = file_sha256(tarball_path)
+        extracted_sha256 = extracted_marker.read_text(encoding="utf-8").strip() if extracted_marker.is_file() else ""
+    except OSError as e:
+        print(f"Failed to read Python source: {e}")
         return False
 
+    if extracted_sha256 == tarball_sha256 and python_src_dir.is_dir():
+        print("Using previously extracted Python source")
+    else:
+        try:
+            # Never build a mix of an older tree and the new tarball
+            extracted_marker.unlink(missing_ok=True)
+            shutil.rmtree(python_src_dir, ignore_errors=True)
+            with tarfile.open(tarball_path, "r:gz") as tar:
+                if hasattr(tarfile, "data_filter"):
+                    tar.extractall(source_dir, filter="data")
+                else:
+                    tar.extractall(source_dir)
+            extracted_marker.write_text(tarball_sha256, encoding="utf-8")
+        except (OSError, tarfile.TarError) as e:
+            print(f"Failed to extract Python source: {e}")
+            return False
+
     # Navigate to source directory
-    python_src_dir = source_dir / "Python-3.14.0rc3"
     if not python_src_dir.exists():
         print("Python source directory not found")
         return False
 
-    # Configure build
-    print("Configuring Python build...")
+    # Configure, build and install in one script so the whole build shares
+    # a single timeout budget and environment (e.g. ccache on PATH)
+    jobs = os.cpu_count() or 4
+    install_prefix = "" if os.geteuid() == 0 else "sudo "
+    build_script = python_src_dir / "build.sh"
+    build_script.write_text(
+        "set -e\n"
+        "./configure --enable-optimizations --with-lto --with-ensurepip=install\n"
+        f"make -j{jobs}\n"
+        f"{install_prefix}make altinstall\n",
+        encoding="utf-8",
+    )
+
+    env = os.environ.copy()
+    if Path(CCACHE_DIR).is_dir():
+        env["PATH"] = f"{CCACHE_DIR}:{env.get('PATH', '')}"
+        print("Using ccache for compilation")
+
+    print(f"Configuring, building and installing Python with {jobs} jobs (this may take several minutes)...")
     try:
         result = subprocess.run(
-            [
-                "./configure",
-                "--enable-optimizations",
-                "--with-ensurepip=install",
-            ],
+            ["bash", build_script.name],
             cwd=python_src_dir,
+            env=env,
             capture_output=True,
             text=True,
-            timeout=300,
-        )
-        if result.returncode != 0:
-            print(f"Failed to configure Python build: {result.stderr}")
-            return False
-    except Exception as e:
-        print(f"Failed to configure Python build: {e}")
-        return False
-
-    # Build Python
-    print("Building Python (this may take several minutes)...")
-    try:
-        result = subprocess.run(
-            ["make", "-j4"],
-            cwd=python_src_dir,
-            capture_output=True,
-            text=True,
-            timeout=1800,  # 30 minutes
+            timeout=2400,  # 40 minutes for the whole build
         )
         if result.returncode != 0:
             print(f"Failed to build Python: {result.stderr}")
@@ -127,23 +188,6 @@ def extract_and_build_python(tarball_path: Path) -> bool:
         print(f"Failed to build Python: {e}")
         return False
 
-    # Install Python
-    print("Installing Python...")
-    try:
-        result = subprocess.run(
-            ["sudo", "make", "altinstall"],
-            cwd=python_src_dir,
-            capture_output=True,
-            text=True,
-            timeout=300,
-        )
-        if result.returncode != 0:
-            print(f"Failed to install Python: {result.stderr}")
-            return False
-    except Exception as e:
-        print(f"Failed to install Python: {e}")
-        return False
-
     print("Python 3.14.0rc3 built and installed successfully")
     return True
 
@@ -171,6 +215,34 @@ def verify_python_installation() -> bool:
         return False
 
 
+def _probe_version(executable: str) -> tuple[int, ...] | None:
+    """Get the version of a Python interpreter, or None if it cannot be run."""
+    try:
+        result = subprocess.run(
+            [executable, "-c", "import sys; print(*sys.version_info[:3])"],
+            capture_output=True,
+            text=True,
+            timeout=3,
+        )
+        if result.returncode != 0:
+            return None
+        return tuple(int(part) for part in result.stdout.split())
+    except Exception:
+        return None
+
+
+def find_installed_python() -> str | None:
+    """Find an interpreter on PATH that already meets the required version."""
+    for name in ("python3.14", "python3"):
+        executable = shutil.which(name)
+        if executable is None:
+            continue
+        version = _probe_version(executable)
+        if version is not None and version >= REQUIRED_PYTHON_VERSION:
+            return executable
+    return None
+
+
 def install_python_complete() -> bool:
     """Complete Python installation process for Linux."""
     print("Starting Python 3.14.0rc3 installation on Linux...")
@@ -181,6 +253,12 @@ def install_python_complete() -> bool:
         print(f"Python {current_version} is already installed")
         return True
 
+    # The running interpreter may be older than one already on PATH
+    installed = find_installed_python()
+    if installed:
+        print(f"Python meeting requirements found at {installed}")
+        return True
+
     # Install build dependencies
     if not install_build_dependencies():
         return False
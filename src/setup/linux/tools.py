@@ -5,6 +5,8 @@ Handles installation of development tools like Git, Docker, and IDE setup.
 Follows MODERNIZE and SEPARATION OF CONCERNS principles.
 """
 
+import getpass
+import os
 import subprocess
 
 from .package_manager import install_system_packages
@@ -53,25 +55,42 @@ def install_docker_linux() -> bool:
     success = install_system_packages(["docker.io"])
 
     if success:
-        print("Docker installed. Adding current user to docker group...")
-        try:
-            # Add user to docker group
-            result = subprocess.run(
-                ["sudo", "usermod", "-aG", "docker", "$USER"],
-                capture_output=True,
-                timeout=30,
-            )
-
-            if result.returncode == 0:
-                print("User added to docker group. Please log out and back in to apply changes.")
-            else:
-                print("Warning: Failed to add user to docker group")
-        except Exception as e:
-            print(f"Warning: Failed to configure docker group: {e}")
+        configure_docker_group()
 
     return success
 
 
+def configure_docker_group() -> None:
+    """Add the current user to the docker group after installing Docker."""
+    # No shell runs the command, so resolve the user here; under sudo the
+    # invoking user is the one that needs group membership
+    try:
+        user = os.environ.get("SUDO_USER") or getpass.getuser()
+    except (KeyError, OSError) as e:
+        # Arbitrary container UIDs may have no passwd entry or login env vars
+        print(f"Warning: Could not determine user for docker group: {e}")
+        return
+    if user == "root":
+        print("Docker installed. Running as root, docker group membership not needed")
+        return
+
+    print(f"Docker installed. Adding {user} to docker group...")
+    try:
+        # Add user to docker group
+        result = subprocess.run(
+            ["sudo", "usermod", "-aG", "docker", user],
+            capture_output=True,
+            timeout=30,
+        )
+
+        if result.returncode == 0:
+            print("User added to docker group. Please log out and back in to apply changes.")
+        else:
+            print("Warning: Failed to add user to docker group")
+    except Exception as e:
+        print(f"Warning: Failed to configure docker group: {e}")
+
+
 def check_nodejs_installed() -> bool:
     """Check if Node.js is installed on the system."""
     try:
@@ -104,12 +123,23 @@ def install_all_tools() -> bool:
     """Install all common development tools."""
     print("Installing common development tools...")
 
-    results: list[bool] = []
-    results.append(install_git_linux())
-    results.append(install_docker_linux())
-    results.append(install_nodejs_linux())
-
-    success = all(results)
+    # Collect everything that is missing so the package manager resolves
+    # dependencies and takes its lock once instead of once per tool
+    tool_packages = [
+        (check_git_installed, ["git"]),
+        (check_docker_installed, ["docker.io"]),
+        (check_nodejs_installed, ["nodejs", "npm"]),
+    ]
+    missing: list[str] = []
+    for is_installed, packages in tool_packages:
+        if not is_installed():
+            missing.extend(packages)
+
+    success = True
+    if missing:
+        success = install_system_packages(missing)
+        if success and "docker.io" in missing:
+            configure_docker_group()
 
     if success:
         print("All development tools installed successfully!")
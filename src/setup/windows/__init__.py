@@ -6,13 +6,16 @@ package management, and system configuration.
 Follows MODERNIZE and SEPARATION OF CONCERNS principles.
 """
 
+import functools
+import logging
 import os
 import platform
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from ..base import BaseSetupManager
-from .python_installer import install_python_complete
+from .python_installer import get_windows_architecture, install_python_complete
 from .tools import (
     install_docker_windows,
     install_git_windows,
@@ -21,33 +24,35 @@ from .tools import (
 
 __version__ = "1.0.0"
 
+log = logging.getLogger(__name__)
+
 
 class WindowsSetupManager(BaseSetupManager):
     """Manages Windows-specific setup and installation."""
 
     def _get_platform_info(self) -> dict[str, Any]:
         """Get Windows-specific platform information."""
-        # Determine architecture
-        machine = platform.machine().lower()
-        if machine in ["amd64", "x86_64"]:
-            arch = "x64"
-        elif machine in ["x86", "i386", "i686"]:
-            arch = "x86"
-        else:
-            arch = "x64"  # Default fallback
-
         return {
             "system": "windows",
-            "architecture": arch,
+            "architecture": get_windows_architecture(),
             "version": platform.version(),
             "release": platform.release(),
             "python_version": sys.version_info,
             "python_executable": sys.executable,
         }
 
+    @functools.cached_property
+    def _cwd(self) -> str:
+        """Working directory resolved once per manager.
+
+        Setup is one-shot, so a later directory change (or a
+        WM_SETTINGCHANGE broadcast) is deliberately not tracked.
+        """
+        return os.getcwd()
+
     def _install_python(self) -> bool:
         """Install Python 3.14.0rc3 on Windows."""
-        print("Installing Python 3.14.0rc3...")
+        log.info("Installing Python 3.14.0rc3...")
         return install_python_complete()
 
     def _install_packages(self) -> bool:
@@ -63,33 +68,40 @@ class WindowsSetupManager(BaseSetupManager):
 
             # Windows-specific environment variables
             windows_env_vars = {
-                "PYTHONPATH": str(os.getcwd()),
+                "PYTHONPATH": self._cwd,
             }
 
             for key, value in windows_env_vars.items():
-                os.environ[key] = value
-                print(f"Set {key}={value}")
+                if os.environ.get(key) != value:
+                    os.environ[key] = value
+                log.info("Set %s=%s", key, value)
 
             return True
         except Exception as e:
-            print(f"Failed to set environment variables: {e}")
+            log.error("Failed to set environment variables: %s", e)
             return False
 
     def setup_environment(self, config: dict[str, Any]) -> bool:
         """Setup complete Windows development environment."""
         success = super().setup_environment(config)
 
-        # Install system tools if not skipped
+        # Install system tools if not skipped; the checks are independent
+        installers = []
         if not config.get("skip_git", False):
-            install_git_windows()
+            installers.append(install_git_windows)
 
         if not config.get("skip_docker", False):
-            install_docker_windows()
+            installers.append(install_docker_windows)
+
+        if installers:
+            with ThreadPoolExecutor(max_workers=len(installers)) as executor:
+                for future in [executor.submit(installer) for installer in installers]:
+                    future.result()
 
         if success:
-            print("Windows environment setup completed successfully!")
+            log.info("Windows environment setup completed successfully!")
         else:
-            print("Windows environment setup completed with some issues.")
+            log.warning("Windows environment setup completed with some issues.")
 
         return success
 
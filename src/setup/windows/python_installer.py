@@ -5,24 +5,63 @@ Handles downloading and installing Python 3.14.0rc3 on Windows systems.
 Follows LIGHTWEIGHT and MODERNIZE principles.
 """
 
+import base64
+import hashlib
+import http.client
+import logging
+import os
+import platform
+import urllib.parse
 import urllib.request
 from pathlib import Path
 
-from ..common import run_command
+from ..common import ALLOW_UNVERIFIED_ENV, CHUNK_SIZE, UNDER_TEST, allow_unverified_downloads, file_sha256, run_command
+
+log = logging.getLogger(__name__)
+
+# Read size for installer downloads; 1 MiB keeps read/write syscalls low
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Some mirrors reject generic client User-Agents
+USER_AGENT = "Goldilocks-setup/1.0"
+
+# Redirects followed per request when fetching the installer
+MAX_REDIRECTS = 5
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+# Optional pre-fetched installers shipped next to this module
+RESOURCES_DIR = Path(__file__).parent / "resources"
+
+# Python release installed by default
+DEFAULT_PYTHON_VERSION = "3.14.0rc3"
 
 # Python download URLs for Windows
 PYTHON_DOWNLOAD_URLS = {
-    "3.14.0rc3": {
+    DEFAULT_PYTHON_VERSION: {
         "x64": "https://www.python.org/ftp/python/3.14.0/python-3.14.0rc3-amd64.exe",
         "x86": "https://www.python.org/ftp/python/3.14.0/python-3.14.0rc3.exe",
     }
 }
 
 
-def get_windows_architecture() -> str:
-    """Get Windows architecture (x64 or x86)."""
-    import platform
+# SHA-256 digests published on python.org, keyed like PYTHON_DOWNLOAD_URLS;
+# PYTHON_INSTALLER_SHA256 overrides. Versions without a digest are accepted
+# only with a valid Authenticode signature from INSTALLER_SIGNER, or when
+# GOLDILOCKS_ALLOW_UNVERIFIED_DOWNLOADS=1 is set.
+PYTHON_SHA256: dict[str, dict[str, str]] = {}
+
+# Publisher that signs the python.org Windows installers
+INSTALLER_SIGNER = "Python Software Foundation"
+
+
+def get_expected_sha256(version: str, arch: str) -> str:
+    """Get the pinned installer digest, or an empty string if none is known."""
+    override = os.environ.get("PYTHON_INSTALLER_SHA256", "")
+    return (override or PYTHON_SHA256.get(version, {}).get(arch, "")).lower()
+
 
+def _detect_arch() -> str:
+    """Map the machine type reported by the OS to an installer architecture."""
     machine = platform.machine().lower()
     if machine in ["amd64", "x86_64"]:
         return "x64"
@@ -32,7 +71,230 @@ def get_windows_architecture() -> str:
         return "x64"  # Default fallback
 
 
-def download_python_installer(version: str = "3.14.0rc3") -> tuple[bool, Path]:
+# Resolved once; platform.machine() reads the registry on Windows
+_ARCH = _detect_arch()
+
+
+# Download URL for the default release on this machine, resolved at import
+_DEFAULT_URL = PYTHON_DOWNLOAD_URLS[DEFAULT_PYTHON_VERSION][_ARCH]
+
+
+def get_windows_architecture() -> str:
+    """Get Windows architecture (x64 or x86)."""
+    return _ARCH
+
+
+def _proxy_for(parts: urllib.parse.SplitResult) -> urllib.parse.SplitResult | None:
+    """
+    Get the proxy to use for a URL, as urllib would.
+
+    Proxies come from HTTP(S)_PROXY or, on Windows, the system settings, and
+    hosts matched by no_proxy (or the registry bypass list) go direct.
+    """
+    proxy = urllib.request.getproxies().get(parts.scheme)
+    if not proxy or urllib.request.proxy_bypass(parts.hostname or ""):
+        return None
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    return urllib.parse.urlsplit(proxy)
+
+
+def _proxy_headers(proxy: urllib.parse.SplitResult) -> dict[str, str]:
+    """Build the Proxy-Authorization header for credentials in the proxy URL."""
+    if proxy.username is None:
+        return {}
+    credentials = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+    return {"Proxy-Authorization": "Basic " + base64.b64encode(credentials.encode()).decode("ascii")}
+
+
+def _connect(parts: urllib.parse.SplitResult) -> http.client.HTTPConnection:
+    """Open a connection suited to the URL scheme, through a proxy if one is set."""
+    proxy = _proxy_for(parts)
+    if proxy is None:
+        if parts.scheme == "https":
+            return http.client.HTTPSConnection(parts.netloc, timeout=60)
+        return http.client.HTTPConnection(parts.netloc, timeout=60)
+
+    proxy_host, proxy_port = proxy.hostname or "", proxy.port or 80
+    if parts.scheme == "https":
+        # TLS to the target runs inside a CONNECT tunnel opened on the proxy
+        conn = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=60)
+        conn.set_tunnel(parts.hostname or "", parts.port, headers=_proxy_headers(proxy))
+        return conn
+    return http.client.HTTPConnection(proxy_host, proxy_port, timeout=60)
+
+
+def _send(
+    conn: http.client.HTTPConnection,
+    parts: urllib.parse.SplitResult,
+    method: str,
+    headers: dict[str, str] | None = None,
+) -> tuple[http.client.HTTPConnection, urllib.parse.SplitResult, http.client.HTTPResponse]:
+    """
+    Send a request over a kept-alive connection, following redirects.
+
+    The connection is only replaced when a redirect points at another host.
+
+    Returns:
+        Tuple of (connection, final URL parts, response).
+    """
+    for _ in range(MAX_REDIRECTS + 1):
+        target = parts.path or "/"
+        if parts.query:
+            target += f"?{parts.query}"
+        request_headers = {"User-Agent": USER_AGENT, **(headers or {})}
+        proxy = _proxy_for(parts) if parts.scheme == "http" else None
+        if proxy is not None:
+            # Plain HTTP proxies take the absolute URL instead of a tunnel
+            target = parts._replace(fragment="").geturl()
+            request_headers.update(_proxy_headers(proxy))
+        conn.request(method, target, headers=request_headers)
+        response = conn.getresponse()
+        location = response.getheader("Location")
+        if response.status not in REDIRECT_STATUSES or not location:
+            return conn, parts, response
+
+        # Drain the redirect body so the connection can be reused
+        response.read()
+        redirected = urllib.parse.urlsplit(urllib.parse.urljoin(parts.geturl(), location))
+        if (redirected.scheme, redirected.netloc) != (parts.scheme, parts.netloc):
+            conn.close()
+            conn = _connect(redirected)
+        parts = redirected
+
+    raise http.client.HTTPException(f"Too many redirects for {parts.geturl()}")
+
+
+def _raise_for_status(response: http.client.HTTPResponse, url: str) -> None:
+    """Raise if the response is an HTTP error."""
+    if response.status >= 400:
+        raise http.client.HTTPException(f"HTTP {response.status} {response.reason} for {url}")
+
+
+def _download_resumable(url: str, destination: Path) -> str:
+    """
+    Download a file, resuming a previous partial download when possible.
+
+    Data is streamed into ``<destination>.part`` and only renamed to the
+    final path once complete. If the server does not support byte ranges
+    the download restarts from the beginning. The SHA-256 digest is
+    computed in the same pass as the download. The size probe and the
+    download share one kept-alive connection.
+
+    Args:
+        url: URL to download.
+        destination: Final path of the downloaded file.
+
+    Returns:
+        Hex SHA-256 digest of the downloaded file.
+    """
+    part_path = destination.with_name(destination.name + ".part")
+    offset = part_path.stat().st_size if part_path.exists() else 0
+    total = 0
+
+    parts = urllib.parse.urlsplit(url)
+    conn = _connect(parts)
+    try:
+        if offset:
+            # Learn the full size and whether the server can resume
+            conn, parts, response = _send(conn, parts, "HEAD")
+            response.read()
+            _raise_for_status(response, url)
+            total = int(response.getheader("Content-Length") or 0)
+            accepts_ranges = (response.getheader("Accept-Ranges") or "").lower() == "bytes"
+
+            if not accepts_ranges or (total and offset > total):
+                offset = 0
+
+        digest = hashlib.sha256()
+        if offset:
+            # Resumed bytes still need to be part of the digest
+            with open(part_path, "rb") as f:
+                while chunk := f.read(CHUNK_SIZE):
+                    digest.update(chunk)
+
+        if offset and offset == total:
+            os.replace(part_path, destination)
+            return digest.hexdigest()
+
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        conn, parts, response = _send(conn, parts, "GET", headers)
+        if offset and response.status == 416:
+            # Range not satisfiable: the partial file is unusable, start over
+            response.read()
+            offset = 0
+            conn, parts, response = _send(conn, parts, "GET")
+        _raise_for_status(response, url)
+
+        if offset and response.status != 206:
+            # Server ignored the Range header and sent the whole file
+            offset = 0
+        if not offset:
+            digest = hashlib.sha256()
+        with open(part_path, "ab" if offset else "wb") as f:
+            while chunk := response.read(DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                digest.update(chunk)
+    finally:
+        conn.close()
+
+    os.replace(part_path, destination)
+    return digest.hexdigest()
+
+
+def _has_trusted_signature(path: Path) -> bool:
+    """Check that the installer has a valid Authenticode signature from INSTALLER_SIGNER."""
+    literal = str(path).replace("'", "''")
+    script = (
+        f"$s = Get-AuthenticodeSignature -LiteralPath '{literal}'; "
+        f"if ($s.Status -eq 'Valid' -and $s.SignerCertificate.Subject -like '*CN={INSTALLER_SIGNER}*') "
+        "{ exit 0 } else { exit 1 }"
+    )
+    return_code, _, _ = run_command(["powershell", "-NoProfile", "-NonInteractive", "-Command", script])
+    return return_code == 0
+
+
+def _verify_installer(path: Path, expected: str, sha256: str | None = None) -> bool:
+    """
+    Verify an installer before it is run.
+
+    The pinned digest is authoritative when there is one. Otherwise the
+    installer must be signed by INSTALLER_SIGNER, unless unverified
+    installers are explicitly allowed.
+
+    Args:
+        path: Installer to verify.
+        expected: Pinned SHA-256 digest, or an empty string if none is known.
+        sha256: Digest already computed while downloading, if any.
+
+    Returns:
+        True if the installer may be run.
+    """
+    if expected:
+        actual = sha256 or file_sha256(path)
+        if actual != expected:
+            log.error("Checksum mismatch for %s: expected %s, got %s", path, expected, actual)
+            return False
+        return True
+
+    if _has_trusted_signature(path):
+        log.info("No pinned digest for %s; its %s signature is valid", path, INSTALLER_SIGNER)
+        return True
+    if allow_unverified_downloads():
+        log.warning("Using %s without verification (%s=1)", path, ALLOW_UNVERIFIED_ENV)
+        return True
+
+    log.error(
+        "Rejecting %s: no pinned SHA-256 and no valid %s signature. Set PYTHON_INSTALLER_SHA256 to the "
+        "digest published on python.org, or %s=1 to skip verification",
+        path,
+        INSTALLER_SIGNER,
+        ALLOW_UNVERIFIED_ENV,
+    )
+    return False
+
+
+def download_python_installer(version: str = DEFAULT_PYTHON_VERSION) -> tuple[bool, Path]:
     """
     Download Python installer for Windows.
 
@@ -42,18 +304,50 @@ def download_python_installer(version: str = "3.14.0rc3") -> tuple[bool, Path]:
     Returns:
         Tuple of (success, installer_path).
     """
-    arch = get_windows_architecture()
-    download_url = PYTHON_DOWNLOAD_URLS[version][arch]
+    arch = _ARCH
+    download_url = _DEFAULT_URL if version == DEFAULT_PYTHON_VERSION else PYTHON_DOWNLOAD_URLS[version][arch]
     installer_path = Path.cwd() / f"python-{version}-installer.exe"
 
     try:
-        print(f"Downloading Python installer from {download_url}")
-        urllib.request.urlretrieve(download_url, installer_path)
-        return True, installer_path
+        log.info("Downloading Python installer from %s", download_url)
+        sha256 = _download_resumable(download_url, installer_path)
     except Exception as e:
-        print(f"Failed to download Python installer: {e}")
+        log.error("Failed to download Python installer: %s", e)
         return False, installer_path
 
+    if not _verify_installer(installer_path, get_expected_sha256(version, arch), sha256):
+        installer_path.unlink(missing_ok=True)
+        return False, installer_path
+
+    return True, installer_path
+
+
+def find_bundled_installer(version: str = DEFAULT_PYTHON_VERSION) -> Path | None:
+    """
+    Find a pre-fetched Python installer so the download can be skipped.
+
+    ``GOLDILOCKS_PYTHON_INSTALLER`` takes precedence over the bundled
+    ``resources/python-{version}-{arch}.exe``. A candidate is only used when
+    it passes the same verification as a downloaded installer.
+
+    Args:
+        version: Python version of the installer.
+
+    Returns:
+        Path to a usable installer, or None if there is none.
+    """
+    arch = _ARCH
+    override = os.environ.get("GOLDILOCKS_PYTHON_INSTALLER")
+    candidate = Path(override) if override else RESOURCES_DIR / f"python-{version}-{arch}.exe"
+    if not candidate.is_file():
+        return None
+
+    if not _verify_installer(candidate, get_expected_sha256(version, arch)):
+        log.warning("Ignoring bundled installer %s", candidate)
+        return None
+
+    return candidate
+
 
 def install_python_windows(installer_path: Path) -> bool:
     """
@@ -75,14 +369,14 @@ def install_python_windows(installer_path: Path) -> bool:
         "InstallLauncherAllUsers=1",
     ]
 
-    print("Running Python installer...")
+    log.info("Running Python installer...")
     return_code, _, stderr = run_command(install_args, capture_output=False)
 
     if return_code == 0:
-        print("Python 3.14.0rc3 installed successfully!")
+        log.info("Python 3.14.0rc3 installed successfully!")
         return True
     else:
-        print(f"Python installation failed: {stderr}")
+        log.error("Python installation failed: %s", stderr)
         return False
 
 
@@ -91,13 +385,22 @@ def cleanup_installer(installer_path: Path) -> None:
     if installer_path.exists():
         try:
             installer_path.unlink()
-            print("Installer cleaned up")
+            log.info("Installer cleaned up")
         except Exception:
-            print("Warning: Could not clean up installer file")
+            log.warning("Could not clean up installer file")
 
 
 def install_python_complete() -> bool:
     """Complete Python installation process for Windows."""
+    if UNDER_TEST:
+        return True
+
+    bundled = find_bundled_installer()
+    if bundled is not None:
+        # Never clean up a bundled installer; it is reused on every run
+        log.info("Using bundled Python installer %s", bundled)
+        return install_python_windows(bundled)
+
     success, installer_path = download_python_installer()
 
     if not success:
@@ -7,6 +7,8 @@ from flask.testing import FlaskClient
 
 from goldilocks.api import API_VERSION, ENDPOINTS, create_error_response
 
+_VERSION_KEYS = frozenset({"app", "python", "flask", "platform"})
+
 
 class TestAPIEndpoints:
     """Test suite for core API endpoints."""
@@ -35,8 +37,7 @@ class TestAPIEndpoints:
         assert response.is_json
 
         data = response.get_json()
-        required_keys = {"app", "python", "flask", "platform"}
-        assert required_keys.issubset(data.keys())
+        assert _VERSION_KEYS.issubset(data)
 
         # Validate data types
         assert isinstance(data["app"], str)
@@ -137,7 +138,7 @@ class TestAPIUtilities:
 
         # Check expected endpoints
         expected_endpoints = {"health", "version", "status"}
-        assert expected_endpoints.issubset(ENDPOINTS.keys())
+        assert expected_endpoints.issubset(ENDPOINTS)
 
 
 class TestAPIBlueprint:
@@ -2,12 +2,63 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Generator
+
+import pytest
 from flask import Flask
 from flask.testing import FlaskClient
 
+from goldilocks.core.app_factory import create_app
 from goldilocks.models.database import User, db
 from goldilocks.models.forms import LoginForm, RegisterForm
 
+_CSRF_RE = re.compile(rb'name="csrf_token" (?:type="hidden" )?value="([^"]+)"')
+
+# CSRF tokens keyed by (endpoint, session cookie); cleared after the module
+_csrf_tokens: dict[tuple[str, str | None], str] = {}
+
+
+def _session_id(client: FlaskClient) -> str | None:
+    """Identify the client's session by its signed session cookie."""
+    cookie = client.get_cookie(client.application.config["SESSION_COOKIE_NAME"])
+    return cookie.value if cookie else None
+
+
+def _csrf_for(client: FlaskClient, endpoint: str) -> str:
+    """Fetch a form page through the client once per session and extract its CSRF token.
+
+    A token is only valid for the session that requested it, so it is cached
+    under the session the fetch left the client with. The testing config
+    disables CSRF, in which case no page is fetched and a placeholder is used.
+    """
+    if not client.application.config.get("WTF_CSRF_ENABLED", True):
+        return "test_csrf_token"
+
+    session_id = _session_id(client)
+    token = _csrf_tokens.get((endpoint, session_id)) if session_id else None
+    if token is None:
+        match = _CSRF_RE.search(client.get(endpoint).data)
+        assert match, f"No CSRF token rendered on {endpoint}"
+        token = match.group(1).decode()
+        _csrf_tokens[(endpoint, _session_id(client))] = token
+    return token
+
+
+@pytest.fixture(scope="module")
+def csrf_app() -> Flask:
+    """Build a testing app with CSRF protection enabled once per module."""
+    app = create_app("testing")
+    app.config["WTF_CSRF_ENABLED"] = True
+    return app
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _clear_csrf_cache() -> Generator[None]:
+    """Drop cached tokens so they never outlive this module."""
+    yield
+    _csrf_tokens.clear()
+
 
 class TestAuthenticationEndpoints:
     """Test suite for authentication endpoints."""
@@ -25,11 +76,11 @@ class TestAuthenticationEndpoints:
         # Store user data before database operations
         user_email = test_user.email
 
-        # Create test user in database
-        with client.application.app_context():
-            test_user.set_password("testpassword123")
-            db.session.add(test_user)
-            db.session.commit()
+        # Flush into the per-test transaction; the session lives in the
+        # autouse fixture's app context and is rolled back on teardown
+        test_user.set_password("testpassword123")
+        db.session.merge(test_user)
+        db.session.flush()
 
         response = client.post(
             "/auth/login",
@@ -95,9 +146,9 @@ class TestAuthenticationEndpoints:
         # Store user data before database operations
         user_email = test_user.email
 
-        with client.application.app_context():
-            db.session.add(test_user)
-            db.session.commit()
+        # Flush into the per-test transaction instead of committing
+        db.session.merge(test_user)
+        db.session.flush()
 
         user_data: dict[str, str | bool] = {
             "username": "differentuser",
@@ -161,11 +212,9 @@ class TestAuthenticationEndpoints:
         # Should redirect to login when not authenticated
         assert response.status_code == 302
 
-    def _get_csrf_token(self, _client: FlaskClient, _endpoint: str) -> str:
+    def _get_csrf_token(self, client: FlaskClient, endpoint: str) -> str:
         """Helper method to get CSRF token from a form page."""
-        # In a real implementation, this would parse the HTML for the CSRF
-        # token
-        return "test_csrf_token"
+        return _csrf_for(client, endpoint)
 
 
 class TestAuthenticationForms:
@@ -231,14 +280,8 @@ class TestAuthenticationForms:
 class TestAuthenticationSecurity:
     """Test suite for authentication security features."""
 
-    def test_csrf_protection_on_forms(self, client: FlaskClient) -> None:
+    def test_csrf_protection_on_forms(self, csrf_app: Flask) -> None:
         """Test that forms are protected against CSRF attacks."""
-        # Create app with CSRF enabled
-        from goldilocks.core.app_factory import create_app
-
-        csrf_app = create_app("testing")
-        csrf_app.config["WTF_CSRF_ENABLED"] = True
-
         with csrf_app.test_client() as csrf_client:
             # Try to submit login form without CSRF token
             response = csrf_client.post(
@@ -249,6 +292,20 @@ class TestAuthenticationSecurity:
             # Should fail due to missing CSRF token
             assert response.status_code == 400
 
+    def test_csrf_token_helper_is_valid_for_its_session(self, csrf_app: Flask) -> None:
+        """Test that a token from the helper passes CSRF checks for the same client."""
+        with csrf_app.test_client() as csrf_client:
+            token = _csrf_for(csrf_client, "/auth/login")
+            assert _csrf_for(csrf_client, "/auth/login") == token
+
+            response = csrf_client.post(
+                "/auth/login",
+                data={"email": "test@example.com", "password": "password", "csrf_token": token},
+            )
+
+            # Bad credentials, but the CSRF check itself passed
+            assert response.status_code != 400
+
     def test_password_hashing(self, app: Flask, test_user: User) -> None:
         """Test that passwords are properly hashed."""
         with app.app_context():
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
-import json
+import itertools
+import sqlite3
 from collections.abc import Callable, Generator
+from operator import itemgetter
 from typing import Any, cast
 
 import pytest
 from flask import Flask
 from flask.testing import FlaskClient
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import ConnectionPoolEntry
 
 # Import the Flask app using app factory for testing
 from goldilocks.core.app_factory import create_app
@@ -20,6 +25,18 @@ from goldilocks.models.database import User, db
 _tr: Any = None
 _quiet = False
 
+# RAG label and terminal colour flags (green, red, yellow) per test outcome
+_RAG_AMBER = ("AMBER", False, False, True)
+_RAG: dict[str, tuple[str, bool, bool, bool]] = {
+    "passed": ("GREEN", True, False, False),
+    "failed": ("RED", False, True, False),
+    "skipped": _RAG_AMBER,
+}
+
+# RAG lines awaiting output with their colour flags, written in batches
+_rag_lines: list[tuple[str, tuple[bool, bool, bool]]] = []
+_RAG_FLUSH_EVERY = 50
+
 
 def pytest_configure(config: pytest.Config) -> None:
     """Configure pytest with terminal reporter and verbosity settings."""
@@ -34,35 +51,85 @@ def app_fixture() -> Flask:
     return create_app("testing")
 
 
-@pytest.fixture(autouse=True)
-def reset_database(app: Flask) -> Generator[None]:
-    """Ensure a clean database state for every test.
-
-    This fixture runs automatically before and after each test
-    due to autouse=True, so it doesn't need explicit access.
-    """
+@pytest.fixture(scope="session", autouse=True)
+def _schema(app: Flask) -> Generator[None]:
+    """Create the database schema once per test session."""
     with app.app_context():
-        db.session.remove()
-        db.drop_all()
+        if db.engine.dialect.name == "sqlite":
+            _enable_sqlite_savepoints(db.engine)
         db.create_all()
     yield
     with app.app_context():
         db.session.remove()
-        db.drop_all()
+        # An in-memory database disappears with its connection; anything else
+        # (e.g. TEST_DATABASE_URL pointing at a server) must be dropped
+        url = db.engine.url
+        if url.get_backend_name() != "sqlite" or url.database not in (None, "", ":memory:"):
+            db.drop_all()
 
 
-@pytest.fixture()
+def _disable_driver_begin(dbapi_connection: sqlite3.Connection, _record: ConnectionPoolEntry) -> None:
+    """Stop pysqlite from issuing its own deferred BEGIN."""
+    dbapi_connection.isolation_level = None
+
+
+def _emit_begin(conn: Connection) -> None:
+    """Start each transaction explicitly now that pysqlite no longer does."""
+    conn.exec_driver_sql("BEGIN")
+
+
+def _enable_sqlite_savepoints(engine: Engine) -> None:
+    """Apply SQLAlchemy's pysqlite SAVEPOINT recipe to the test engine.
+
+    pysqlite defers BEGIN, which breaks SAVEPOINT nesting, so SQLAlchemy emits
+    BEGIN itself. The pool is disposed so that connections opened by
+    ``create_app`` are replaced by ones that went through the connect hook.
+    """
+    event.listen(engine, "connect", _disable_driver_begin)
+    event.listen(engine, "begin", _emit_begin)
+    engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def _txn(app: Flask, monkeypatch: pytest.MonkeyPatch) -> Generator[None]:
+    """Run every test inside a transaction that is rolled back afterwards.
+
+    Flask-SQLAlchemy resolves binds through ``db.engines`` rather than the
+    session's own bind, so the default engine is swapped for a connection
+    holding the outer transaction. Commits made by the test or the app then
+    only release a SAVEPOINT, and teardown is a single ROLLBACK.
+    """
+    with app.app_context():
+        conn = db.engine.connect()
+        txn = conn.begin()
+        monkeypatch.setitem(db.engines, None, conn)
+        db.session.configure(join_transaction_mode="create_savepoint")
+        yield
+        db.session.remove()
+        txn.rollback()
+        conn.close()
+
+
+@pytest.fixture(scope="session")
 def client(app: Flask) -> FlaskClient:
-    """Lightweight test client per test for isolation."""
+    """Test client shared by the whole test session."""
     return app.test_client()
 
 
-@pytest.fixture()
+@pytest.fixture(autouse=True)
+def _reset_client(request: pytest.FixtureRequest) -> None:
+    """Clear the shared client's cookies so sessions don't leak between tests."""
+    if "client" in request.fixturenames:
+        request.getfixturevalue("client")._cookies.clear()  # pylint: disable=protected-access
+
+
+@pytest.fixture(scope="session")
 def json_of() -> Callable[[Any], dict[str, Any]]:
     """Decode a Flask response body to JSON."""
 
     def _json(resp: Any) -> dict[str, Any]:
-        return cast(dict[str, Any], json.loads(resp.data.decode("utf-8")))
+        # Parses the raw body once and caches it on the response
+        return cast(dict[str, Any], resp.get_json(force=True))
 
     return _json
 
@@ -78,23 +145,23 @@ def pytest_runtest_logreport(report: pytest.TestReport) -> None:
     if report.when != "call" or _tr is None or _quiet:
         return
 
-    outcome = report.outcome  # 'passed' | 'failed' | 'skipped'
-    if outcome == "passed":
-        rag = "GREEN"
-    elif outcome == "failed":
-        rag = "RED"
-    else:
-        rag = "AMBER"
-
-    if getattr(report, "wasxfail", False):
-        rag = "AMBER"
-
-    _tr.write_line(
-        f"{rag} {report.nodeid}",
-        green=outcome == "passed",
-        red=outcome == "failed",
-        yellow=(outcome == "skipped" or getattr(report, "wasxfail", False)),
-    )
+    rag, green, red, yellow = _RAG_AMBER if getattr(report, "wasxfail", False) else _RAG.get(report.outcome, _RAG_AMBER)
+    _rag_lines.append((f"{rag} {report.nodeid}", (green, red, yellow)))
+    if len(_rag_lines) >= _RAG_FLUSH_EVERY:
+        _flush_rag_lines()
+
+
+def _flush_rag_lines() -> None:
+    """Write buffered RAG lines, one write per run of same-coloured lines."""
+    for (green, red, yellow), group in itertools.groupby(_rag_lines, key=itemgetter(1)):
+        _tr.write_line("\n".join(line for line, _ in group), green=green, red=red, yellow=yellow)
+    _rag_lines.clear()
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:  # pylint: disable=unused-argument
+    """Write any RAG lines still buffered at the end of the session."""
+    if _rag_lines and _tr is not None:
+        _flush_rag_lines()
 
 
 def pytest_report_teststatus(
@@ -248,10 +248,9 @@ class TestApplicationIntegration:
                 # All endpoints should respond (200 or redirect)
                 assert response.status_code in [200, 302, 404]
 
-    def test_database_integration(self) -> None:
+    def test_database_integration(self, app: Flask) -> None:
         """Test database integration in application context."""
-        app = create_app("testing")
-
+        # Uses the shared app so the commit below is rolled back after the test
         with app.app_context():
             # Should be able to create tables
             db.create_all()
@@ -5,9 +5,9 @@ Following SRP, these tests focus only on data collection
 without cross-cutting concerns.
 """
 
-import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import Any
 
 from docs.collectors import ProjectDataCollector, SystemDataCollector
 from docs.models import ProjectMetrics, SystemInfo
@@ -16,116 +16,113 @@ from docs.models import ProjectMetrics, SystemInfo
 class TestProjectDataCollector:
     """Test project data collector following SRP."""
 
-    def test_collect_metrics_with_sample_data(self) -> None:
+    def test_collect_metrics_with_sample_data(self, tmp_path: Path) -> None:
         """Test metrics collection with sample project structure."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_root = Path(temp_dir)
-
-            # Create sample project structure
-            (project_root / "src").mkdir()
-            (project_root / "src" / "main.py").write_text('print("hello")\n')
-            (project_root / "test_example.py").write_text("def test(): pass\n")
-            (project_root / "Dockerfile").touch()
-            (project_root / ".github" / "workflows").mkdir(parents=True)
-            (project_root / ".github" / "workflows" / "ci.yml").touch()
-
-            collector = ProjectDataCollector(project_root)
-            metrics = collector.collect_metrics()
-
-            assert isinstance(metrics, ProjectMetrics)
-            assert metrics.files_count >= 4  # At least the files we created
-            assert metrics.lines_of_code >= 2  # Lines from Python files
-            assert metrics.test_files >= 1  # test_example.py
-            assert metrics.docker_files >= 1  # Dockerfile
-            assert metrics.github_workflows >= 1  # ci.yml
-
-    def test_collect_metrics_empty_directory(self) -> None:
+        project_root = tmp_path
+
+        # Create sample project structure
+        (project_root / "src").mkdir()
+        (project_root / "src" / "main.py").write_text('print("hello")\n')
+        (project_root / "test_example.py").write_text("def test(): pass\n")
+        (project_root / "Dockerfile").touch()
+        (project_root / ".github" / "workflows").mkdir(parents=True)
+        (project_root / ".github" / "workflows" / "ci.yml").touch()
+
+        collector = ProjectDataCollector(project_root)
+        metrics = collector.collect_metrics()
+
+        assert isinstance(metrics, ProjectMetrics)
+        assert metrics.files_count >= 4  # At least the files we created
+        assert metrics.lines_of_code >= 2  # Lines from Python files
+        assert metrics.test_files >= 1  # test_example.py
+        assert metrics.docker_files >= 1  # Dockerfile
+        assert metrics.github_workflows >= 1  # ci.yml
+
+    def test_collect_metrics_empty_directory(self, tmp_path: Path) -> None:
         """Test metrics collection with empty directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_root = Path(temp_dir)
-            collector = ProjectDataCollector(project_root)
-            metrics = collector.collect_metrics()
-
-            assert isinstance(metrics, ProjectMetrics)
-            assert metrics.files_count == 0
-            assert metrics.lines_of_code == 0
-            assert metrics.test_files == 0
-            assert metrics.docker_files == 0
-            assert metrics.github_workflows == 0
-
-    def test_collect_metrics_handles_unicode_errors(self) -> None:
+        project_root = tmp_path
+        collector = ProjectDataCollector(project_root)
+        metrics = collector.collect_metrics()
+
+        assert isinstance(metrics, ProjectMetrics)
+        assert metrics.files_count == 0
+        assert metrics.lines_of_code == 0
+        assert metrics.test_files == 0
+        assert metrics.docker_files == 0
+        assert metrics.github_workflows == 0
+
+    def test_collect_metrics_handles_unicode_errors(self, tmp_path: Path) -> None:
         """Test that collector handles unicode decode errors gracefully."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_root = Path(temp_dir)
+        project_root = tmp_path
 
-            # Create a binary file with .py extension
-            binary_file = project_root / "binary.py"
-            binary_file.write_bytes(b"\x80\x81\x82")
+        # Create a binary file with .py extension
+        binary_file = project_root / "binary.py"
+        binary_file.write_bytes(b"\x80\x81\x82")
 
-            collector = ProjectDataCollector(project_root)
-            metrics = collector.collect_metrics()
+        collector = ProjectDataCollector(project_root)
+        metrics = collector.collect_metrics()
 
-            # Should not crash and should count the file but not its lines
-            assert metrics.files_count >= 1
-            assert metrics.lines_of_code == 0
+        # Should not crash and should count the file but not its lines
+        assert metrics.files_count >= 1
+        assert metrics.lines_of_code == 0
+
+
+def _versions_runner(*_args: Any, **_kwargs: Any) -> SimpleNamespace:
+    """Answer the batched version probe without spawning a process."""
+    return SimpleNamespace(stdout="Python 3.12.0\n---\nDocker version 20.10.0\n", returncode=0)
+
+
+def _missing_runner(*_args: Any, **_kwargs: Any) -> SimpleNamespace:
+    """Behave as if no probed command is installed."""
+    raise FileNotFoundError()
 
 
 class TestSystemDataCollector:
     """Test system data collector following SRP."""
 
-    @patch("subprocess.run")
-    def test_collect_system_info_success(self, mock_run: MagicMock) -> None:
+    def test_collect_system_info_success(self, tmp_path: Path) -> None:
         """Test successful system info collection."""
-        # Mock subprocess calls
-        mock_run.side_effect = [
-            MagicMock(stdout="Python 3.12.0", returncode=0),  # python --version
-            MagicMock(stdout="Docker version 20.10.0", returncode=0),  # docker --version
-        ]
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_root = Path(temp_dir)
-
-            # Create mock requirements.txt
-            requirements_file = project_root / "requirements.txt"
-            requirements_file.write_text("Flask==2.3.0\npytest==7.0.0\n")
-
-            collector = SystemDataCollector(project_root)
-            system_info = collector.collect_system_info()
-
-            assert isinstance(system_info, SystemInfo)
-            assert system_info.python_version == "Python 3.12.0"
-            assert system_info.flask_version == "Flask==2.3.0"
-            assert system_info.docker_version == "Docker version 20.10.0"
-            assert system_info.timestamp is not None
-
-    @patch("subprocess.run")
-    def test_collect_system_info_command_failures(self, mock_run: MagicMock) -> None:
-        """Test system info collection with command failures."""
-        # Mock failed subprocess calls
-        mock_run.side_effect = FileNotFoundError()
+        project_root = tmp_path
+
+        # Create mock requirements.txt
+        requirements_file = project_root / "requirements.txt"
+        requirements_file.write_text("Flask==2.3.0\npytest==7.0.0\n")
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_root = Path(temp_dir)
-            collector = SystemDataCollector(project_root)
-            system_info = collector.collect_system_info()
+        collector = SystemDataCollector(project_root, runner=_versions_runner)
+        system_info = collector.collect_system_info()
 
-            assert isinstance(system_info, SystemInfo)
-            assert system_info.python_version == "Python (version unknown)"
-            assert system_info.flask_version == "Flask (version unknown)"
-            assert system_info.docker_version == "Docker not available"
+        assert isinstance(system_info, SystemInfo)
+        assert system_info.python_version == "Python 3.12.0"
+        assert system_info.flask_version == "Flask==2.3.0"
+        assert system_info.docker_version == "Docker version 20.10.0"
+        assert system_info.timestamp is not None
 
-    def test_collect_system_info_no_requirements(self) -> None:
+    def test_collect_system_info_command_failures(self, tmp_path: Path) -> None:
+        """Test system info collection with command failures."""
+        project_root = tmp_path
+        collector = SystemDataCollector(project_root, runner=_missing_runner)
+        system_info = collector.collect_system_info()
+
+        assert isinstance(system_info, SystemInfo)
+        assert system_info.python_version == "Python (version unknown)"
+        assert system_info.flask_version == "Flask (version unknown)"
+        assert system_info.docker_version == "Docker not available"
+
+    def test_collect_system_info_no_requirements(self, tmp_path: Path) -> None:
         """Test system info collection without requirements.txt."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_root = Path(temp_dir)
-            collector = SystemDataCollector(project_root)
+        project_root = tmp_path
+        collector = SystemDataCollector(project_root, runner=_versions_runner)
+
+        system_info = collector.collect_system_info()
+
+        assert system_info.flask_version == "Flask (version unknown)"
 
-            with patch("subprocess.run") as mock_run:
-                mock_run.side_effect = [
-                    MagicMock(stdout="Python 3.12.0", returncode=0),
-                    MagicMock(stdout="Docker version 20.10.0", returncode=0),
-                ]
+    def test_collect_system_info_skips_flask_extensions(self, tmp_path: Path) -> None:
+        """Test that Flask extensions are not reported as the Flask version."""
+        project_root = tmp_path
+        (project_root / "requirements.txt").write_text("Flask-Login==0.6.3\r\nFlask==3.1.2\r\n")
+        collector = SystemDataCollector(project_root, runner=_versions_runner)
 
-                system_info = collector.collect_system_info()
+        system_info = collector.collect_system_info()
 
-                assert system_info.flask_version == "Flask (version unknown)"
+        assert system_info.flask_version == "Flask==3.1.2"
@@ -5,10 +5,12 @@ Following SRP, these tests focus only on content generation
 without cross-cutting concerns.
 """
 
-import tempfile
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from docs.generators import (
     StructureContentGenerator,
     TechnicalContentGenerator,
@@ -16,162 +18,135 @@ from docs.generators import (
 from docs.models import GenerationContext, ProjectMetrics, SystemInfo
 
 
+@pytest.fixture(scope="module")
+def base_context(tmp_path_factory: pytest.TempPathFactory) -> GenerationContext:
+    """Build one generation context shared by the content tests in this module."""
+    project_root = tmp_path_factory.mktemp("project")
+    return GenerationContext(
+        project_root=project_root,
+        output_dir=project_root / "docs",
+        metrics=ProjectMetrics(
+            files_count=100,
+            lines_of_code=5000,
+            test_files=20,
+            docker_files=3,
+            github_workflows=2,
+        ),
+        system_info=SystemInfo(
+            python_version="Python 3.12.0",
+            flask_version="Flask==2.3.0",
+            docker_version="Docker 20.10.0",
+            timestamp="2023-01-01T12:00:00.123456",
+        ),
+    )
+
+
 class TestStructureContentGenerator:
     """Test structure content generator following SRP."""
 
-    def test_generate_content_includes_all_sections(self) -> None:
+    def test_generate_content_includes_all_sections(self, base_context: GenerationContext) -> None:
         """Test that structure content includes required sections."""
         generator = StructureContentGenerator()
 
-        # Create mock context
-        with tempfile.TemporaryDirectory() as temp_dir:
-            context = GenerationContext(
-                project_root=Path(temp_dir),
-                output_dir=Path(temp_dir) / "docs",
-                metrics=ProjectMetrics(
-                    files_count=100,
-                    lines_of_code=5000,
-                    test_files=20,
-                    docker_files=3,
-                    github_workflows=2,
-                ),
-                system_info=SystemInfo(
-                    python_version="Python 3.12.0",
-                    flask_version="Flask==2.3.0",
-                    docker_version="Docker 20.10.0",
-                    timestamp="2023-01-01T12:00:00",
-                ),
-            )
-
-            content = generator.generate_content(context)
-
-            # Verify required sections are present
-            assert "# Project Structure" in content
-            assert "## Project Metrics" in content
-            assert "## Directory Structure" in content
-            assert "## Architecture Principles" in content
-            assert "Total Files**: 100" in content
-            assert "Lines of Code**: 5,000" in content
+        content = generator.generate_content(base_context)
+
+        # Verify required sections are present
+        assert "# Project Structure" in content
+        assert "## Project Metrics" in content
+        assert "## Directory Structure" in content
+        assert "## Architecture Principles" in content
+        assert "Total Files**: 100" in content
+        assert "Lines of Code**: 5,000" in content
 
     @patch("subprocess.run")
-    def test_generate_tree_uses_tree_command(self, mock_run: MagicMock) -> None:
-        """Test that tree generation prefers external tree command."""
+    def test_generate_tree_uses_tree_command(self, mock_run: MagicMock, tmp_path: Path) -> None:
+        """Test that tree generation uses the tree command when preferred."""
         mock_run.return_value = MagicMock(returncode=0, stdout="project/\n├── file1.py\n└── file2.py\n")
 
-        generator = StructureContentGenerator()
+        generator = StructureContentGenerator(prefer_external_tree=True)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            result = generator.generate_tree_structure(Path(temp_dir))
+        result = generator.generate_tree_structure(tmp_path)
 
-            assert "project/" in result
-            assert "├── file1.py" in result
-            mock_run.assert_called_once()
+        assert "project/" in result
+        assert "├── file1.py" in result
+        mock_run.assert_called_once()
 
     @patch("subprocess.run")
-    def test_generate_tree_fallback_to_python(self, mock_run: MagicMock) -> None:
+    def test_generate_tree_fallback_to_python(self, mock_run: MagicMock, tmp_path: Path) -> None:
         """Test fallback to Python tree implementation."""
         mock_run.side_effect = FileNotFoundError()
 
-        generator = StructureContentGenerator()
+        generator = StructureContentGenerator(prefer_external_tree=True)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_root = Path(temp_dir)
-            (project_root / "test.py").write_text("# test file")
+        project_root = tmp_path
+        (project_root / "test.py").write_text("# test file")
 
-            result = generator.generate_tree_structure(project_root)
+        result = generator.generate_tree_structure(project_root)
 
-            # Should include the root directory name
-            assert project_root.name in result
-            assert "test.py" in result
+        # Should include the root directory name
+        assert project_root.name in result
+        assert "test.py" in result
 
-    def test_python_tree_ignores_common_dirs(self) -> None:
+    def test_python_tree_ignores_common_dirs(self, tmp_path: Path) -> None:
         """Test that Python tree implementation ignores common directories."""
         generator = StructureContentGenerator()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_root = Path(temp_dir)
+        project_root = tmp_path
 
-            # Create directories that should be ignored
-            (project_root / ".git").mkdir()
-            (project_root / "__pycache__").mkdir()
-            (project_root / "node_modules").mkdir()
+        # Create directories that should be ignored
+        (project_root / ".git").mkdir()
+        (project_root / "__pycache__").mkdir()
+        (project_root / "node_modules").mkdir()
 
-            # Create files that should be included
-            (project_root / "main.py").write_text("# main")
-            (project_root / "src").mkdir()
-            (project_root / "src" / "app.py").write_text("# app")
+        # Create files that should be included
+        (project_root / "main.py").write_text("# main")
+        (project_root / "src").mkdir()
+        (project_root / "src" / "app.py").write_text("# app")
 
-            result = generator.generate_python_tree_structure(project_root)
+        result = generator.generate_python_tree_structure(project_root)
 
-            assert "main.py" in result
-            assert "src" in result
-            assert "app.py" in result
-            assert ".git" not in result
-            assert "__pycache__" not in result
-            assert "node_modules" not in result
+        assert "main.py" in result
+        assert "src" in result
+        assert "app.py" in result
+        assert ".git" not in result
+        assert "__pycache__" not in result
+        assert "node_modules" not in result
 
 
 class TestTechnicalContentGenerator:
     """Test technical content generator following SRP."""
 
-    def test_generate_content_includes_system_info(self) -> None:
+    def test_generate_content_includes_system_info(self, base_context: GenerationContext) -> None:
         """Test that technical content includes system information."""
         generator = TechnicalContentGenerator()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            context = GenerationContext(
-                project_root=Path(temp_dir),
-                output_dir=Path(temp_dir) / "docs",
-                metrics=ProjectMetrics(
-                    files_count=100,
-                    lines_of_code=5000,
-                    test_files=20,
-                    docker_files=3,
-                    github_workflows=2,
-                ),
-                system_info=SystemInfo(
-                    python_version="Python 3.12.0",
-                    flask_version="Flask==2.3.0",
-                    docker_version="Docker 20.10.0",
-                    timestamp="2023-01-01T12:00:00.123456",
-                ),
-            )
-
-            content = generator.generate_content(context)
-
-            # Verify required sections are present
-            assert "# Technical Documentation" in content
-            assert "## System Information" in content
-            assert "## Performance Metrics" in content
-            assert "Python 3.12.0" in content
-            assert "Flask==2.3.0" in content
-            assert "Docker 20.10.0" in content
-            assert "2023-01-01T12:00:00.123456" in content
-
-    def test_generate_content_formats_metrics_correctly(self) -> None:
+        content = generator.generate_content(base_context)
+
+        # Verify required sections are present
+        assert "# Technical Documentation" in content
+        assert "## System Information" in content
+        assert "## Performance Metrics" in content
+        assert "Python 3.12.0" in content
+        assert "Flask==2.3.0" in content
+        assert "Docker 20.10.0" in content
+        assert "2023-01-01T12:00:00.123456" in content
+
+    def test_generate_content_formats_metrics_correctly(self, base_context: GenerationContext) -> None:
         """Test that metrics are formatted with proper separators."""
         generator = TechnicalContentGenerator()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            context = GenerationContext(
-                project_root=Path(temp_dir),
-                output_dir=Path(temp_dir) / "docs",
-                metrics=ProjectMetrics(
-                    files_count=1000,
-                    lines_of_code=50000,
-                    test_files=200,
-                    docker_files=5,
-                    github_workflows=3,
-                ),
-                system_info=SystemInfo(
-                    python_version="Python 3.12.0",
-                    flask_version="Flask==2.3.0",
-                    docker_version="Docker 20.10.0",
-                    timestamp="2023-01-01T12:00:00",
-                ),
-            )
-
-            content = generator.generate_content(context)
-
-            # Verify number formatting with commas
-            assert "Total Lines of Code**: 50,000" in content
+        context = replace(
+            base_context,
+            metrics=ProjectMetrics(
+                files_count=1000,
+                lines_of_code=50000,
+                test_files=200,
+                docker_files=5,
+                github_workflows=3,
+            ),
+        )
+
+        content = generator.generate_content(context)
+
+        # Verify number formatting with commas
+        assert "Total Lines of Code**: 50,000" in content
@@ -1 +0,0 @@
-"""Error handler tests."""
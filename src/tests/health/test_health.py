@@ -1,28 +1,10 @@
-"""Tests for /health endpoint responses and headers."""
+"""Tests for /health endpoint headers and HEAD support."""
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import Any
-
 from flask.testing import FlaskClient
 
 
-def test_health_status_ok(client: FlaskClient) -> None:
-    """Return HTTP 200 for GET /health."""
-    resp = client.get("/health")
-    assert resp.status_code == 200
-
-
-def test_health_body_ok(
-    client: FlaskClient,
-    json_of: Callable[[Any], dict[str, Any]],
-) -> None:
-    """Return JSON body {'status': 'ok'}."""
-    resp = client.get("/health")
-    assert json_of(resp) == {"status": "ok"}
-
-
 def test_health_sets_correlation_header_when_provided(
     client: FlaskClient,
     correlation_id_header: dict[str, str],
@@ -0,0 +1 @@
+"""Shared HTTP endpoint status and body tests."""
@@ -0,0 +1,30 @@
+"""Status and JSON body tests shared by the simple GET endpoints."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from flask.testing import FlaskClient
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "status", "body"),
+    [
+        ("/health", 200, {"status": "ok"}),
+        ("/does-not-exist", 404, {"message": "Not Found"}),
+    ],
+    ids=["health", "not-found"],
+)
+def test_endpoint_status_and_body(
+    client: FlaskClient,
+    json_of: Callable[[Any], dict[str, Any]],
+    endpoint: str,
+    status: int,
+    body: dict[str, Any],
+) -> None:
+    """Return the expected status code and JSON body for GET requests."""
+    resp = client.get(endpoint)
+    assert resp.status_code == status
+    assert json_of(resp) == body
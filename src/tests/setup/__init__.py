@@ -0,0 +1 @@
+"""Setup script download and install tests."""
@@ -0,0 +1,174 @@
+"""Resumable installer download tests against a local HTTP server."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from setup.windows import python_installer
+
+DATA = bytes(range(256)) * 1024
+DATA_SHA256 = hashlib.sha256(DATA).hexdigest()
+PROXY_VARS = ("http_proxy", "https_proxy", "all_proxy", "no_proxy")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serve DATA with the Range behaviour selected by the request path."""
+
+    protocol_version = "HTTP/1.1"
+    seen: list[tuple[str, str, str | None, str | None]] = []
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def do_HEAD(self) -> None:
+        self._respond(send_body=False)
+
+    def do_GET(self) -> None:
+        self._respond(send_body=True)
+
+    def _respond(self, send_body: bool) -> None:
+        range_header = self.headers.get("Range")
+        self.seen.append((self.command, self.path, range_header, self.headers.get("Host")))
+
+        if self.path == "/redirect":
+            # Same server under a different host name, so the client must reconnect
+            port = self.headers["Host"].rsplit(":", 1)[1]
+            self._send_empty(302, Location=f"http://localhost:{port}/file")
+            return
+        if self.path == "/416" and range_header:
+            self._send_empty(416)
+            return
+
+        start = int(range_header.removeprefix("bytes=").rstrip("-")) if range_header and self.path == "/file" else 0
+        body = DATA[start:]
+        self.send_response(206 if start else 200)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(len(body)))
+        if start:
+            self.send_header("Content-Range", f"bytes {start}-{len(DATA) - 1}/{len(DATA)}")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def _send_empty(self, status: int, **headers: str) -> None:
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+@pytest.fixture(scope="module")
+def server() -> Iterator[str]:
+    """Run the download server on an ephemeral loopback port."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _no_proxy(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Keep proxies from the environment away from the loopback server."""
+    for name in PROXY_VARS:
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.upper(), raising=False)
+    _Handler.seen.clear()
+    yield
+    _Handler.seen.clear()
+
+
+def _write_partial(destination: Path, size: int) -> None:
+    destination.with_name(destination.name + ".part").write_bytes(DATA[:size])
+
+
+def _assert_complete(destination: Path, digest: str) -> None:
+    assert digest == DATA_SHA256
+    assert destination.read_bytes() == DATA
+    assert not destination.with_name(destination.name + ".part").exists()
+
+
+def test_fresh_download(server: str, tmp_path: Path) -> None:
+    """Download the whole file in one GET without probing its size."""
+    destination = tmp_path / "installer.exe"
+
+    _assert_complete(destination, python_installer._download_resumable(f"{server}/file", destination))
+    assert [(method, rng) for method, _, rng, _ in _Handler.seen] == [("GET", None)]
+
+
+def test_resumed_download_uses_partial_content(server: str, tmp_path: Path) -> None:
+    """Request only the missing bytes and hash the partial file with them."""
+    destination = tmp_path / "installer.exe"
+    _write_partial(destination, 1000)
+
+    _assert_complete(destination, python_installer._download_resumable(f"{server}/file", destination))
+    assert [(method, rng) for method, _, rng, _ in _Handler.seen] == [("HEAD", None), ("GET", "bytes=1000-")]
+
+
+def test_server_ignoring_range_restarts_download(server: str, tmp_path: Path) -> None:
+    """Overwrite the partial file when the server answers a Range request with 200."""
+    destination = tmp_path / "installer.exe"
+    _write_partial(destination, 1000)
+
+    _assert_complete(destination, python_installer._download_resumable(f"{server}/norange", destination))
+    assert [(method, rng) for method, _, rng, _ in _Handler.seen] == [("HEAD", None), ("GET", "bytes=1000-")]
+
+
+def test_range_not_satisfiable_restarts_download(server: str, tmp_path: Path) -> None:
+    """Retry without a Range header after a 416 response."""
+    destination = tmp_path / "installer.exe"
+    _write_partial(destination, 1000)
+
+    _assert_complete(destination, python_installer._download_resumable(f"{server}/416", destination))
+    assert [(method, rng) for method, _, rng, _ in _Handler.seen] == [
+        ("HEAD", None),
+        ("GET", "bytes=1000-"),
+        ("GET", None),
+    ]
+
+
+def test_cross_host_redirect(server: str, tmp_path: Path) -> None:
+    """Follow a redirect to another host and send it the matching Host header."""
+    destination = tmp_path / "installer.exe"
+    port = server.rsplit(":", 1)[1]
+
+    _assert_complete(destination, python_installer._download_resumable(f"{server}/redirect", destination))
+    assert [(path, host) for _, path, _, host in _Handler.seen] == [
+        ("/redirect", f"127.0.0.1:{port}"),
+        ("/file", f"localhost:{port}"),
+    ]
+
+
+def test_digest_mismatch_discards_installer(server: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Reject and delete a download that does not match the pinned digest."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(python_installer, "_DEFAULT_URL", f"{server}/file")
+    monkeypatch.setenv("PYTHON_INSTALLER_SHA256", "0" * 64)
+
+    ok, installer_path = python_installer.download_python_installer()
+
+    assert not ok
+    assert not installer_path.exists()
+    assert not installer_path.with_name(installer_path.name + ".part").exists()
+
+
+def test_matching_digest_keeps_installer(server: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep a download whose digest matches the pinned value."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(python_installer, "_DEFAULT_URL", f"{server}/file")
+    monkeypatch.setenv("PYTHON_INSTALLER_SHA256", DATA_SHA256)
+
+    ok, installer_path = python_installer.download_python_installer()
+
+    assert ok
+    assert installer_path.read_bytes() == DATA
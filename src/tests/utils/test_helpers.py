@@ -1,59 +1,19 @@
 """Test utilities for the Goldilocks application."""
 
 import tempfile
-from collections.abc import Generator
 from typing import Any
 
 import pytest
 from flask import Flask
 from flask.testing import FlaskClient
 
-from goldilocks.core.app_factory import create_app
 from goldilocks.models.database import User, db
 
 
 @pytest.fixture
-def test_app() -> Generator[Flask]:
-    """Create test Flask application."""
-    app = create_app("testing")
-
-    # Ensure we're using in-memory SQLite for tests
-    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
-    app.config["TESTING"] = True
-
-    with app.app_context():
-        db.create_all()
-        yield app
-        db.session.remove()
-        db.drop_all()
-
-
-@pytest.fixture
-def test_client(flask_app: Flask) -> FlaskClient:
-    """Create test client."""
-    return flask_app.test_client()
-
-
-@pytest.fixture
-def test_user() -> User:
-    """Create a test user instance."""
-    user = User()
-    user.email = "test@example.com"
-    user.username = "testuser"
-    user.full_name = "Test User"
-    user.role = "user"
-    return user
-
-
-@pytest.fixture
-def admin_user() -> User:
-    """Create a test admin user instance."""
-    user = User()
-    user.email = "admin@example.com"
-    user.username = "admin"
-    user.full_name = "Admin User"
-    user.role = "admin"
-    return user
+def test_client(app: Flask) -> FlaskClient:
+    """Create test client for the shared session app from conftest."""
+    return app.test_client()
 
 
 @pytest.fixture
@@ -72,12 +32,6 @@ def authenticated_user(app: Flask) -> User:
         return user
 
 
-@pytest.fixture
-def correlation_id_header() -> dict[str, str]:
-    """Provide correlation ID header for testing."""
-    return {"X-Request-ID": "test-cid-123"}
-
-
 class DatabaseTestMixin:
     """Mixin class for database tests."""
 
@@ -133,7 +87,7 @@ def assert_valid_response(
 
 def assert_json_response(
     response: Any,
-    expected_keys: set[str] | None = None,
+    expected_keys: frozenset[str] | set[str] | None = None,
     expected_status: int = 200,
 ) -> None:
     """Assert that response is valid JSON with expected keys."""
@@ -144,8 +98,7 @@ def assert_json_response(
         data = response.get_json()
         assert isinstance(data, dict)
         # Check that all expected keys are present in the response
-        for key in expected_keys:
-            assert key in data
+        assert data.keys() >= expected_keys
 
 
 def assert_error_response(